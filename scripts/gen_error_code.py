@@ -0,0 +1,45 @@
+"""Generate the merged `ErrorCode` enum as a plain Python module.
+
+`ErrorCode` combines the HTTP, user and database error codes. Rather than
+merging the enums with `EnumHelper.merge` on every import, the merged enum is
+written out once here and committed, so importing it is a single class statement.
+
+Run from the repository root whenever one of the source enums changes:
+    uv run python -m scripts.gen_error_code
+"""
+
+from pathlib import Path
+
+from src.domain.user.errors import UserErrorCode
+from src.helpers.enum import EnumHelper
+from src.http.error_management.error_code_sources import DatabaseErrorCode
+from src.http.error_management.error_code_sources import HttpErrorCode
+
+GENERATED_MODULE = (
+    Path(__file__).parent.parent
+    / "src"
+    / "http"
+    / "error_management"
+    / "_error_code_generated.py"
+)
+
+HEADER = (
+    "# Generated by scripts/gen_error_code.py from HttpErrorCode, UserErrorCode and\n"
+    "# DatabaseErrorCode. Do not edit by hand: rerun the script instead.\n"
+)
+
+
+def main() -> None:
+    """Write the merged ErrorCode enum module."""
+    source = EnumHelper.merge_to_source(
+        "ErrorCode",
+        HttpErrorCode,
+        UserErrorCode,
+        DatabaseErrorCode,
+    )
+    GENERATED_MODULE.write_text(HEADER + source)
+    print(f"Wrote {GENERATED_MODULE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,15 @@ from src.application.registration.ports.activation_code_repository import (
 )
 from src.application.registration.ports.email_service import EmailService
 from src.application.registration.ports.password_hasher import PasswordHasher
+from src.application.registration.ports.task_scheduler import TaskScheduler
+from src.application.registration.ports.unit_of_work import UnitOfWork
 from src.application.registration.ports.user_repository import UserRepository
 
 __all__ = [
     "ActivationCodeRepository",
     "EmailService",
     "PasswordHasher",
+    "TaskScheduler",
+    "UnitOfWork",
     "UserRepository",
 ]
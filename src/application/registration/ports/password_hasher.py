@@ -11,9 +11,11 @@ class PasswordHasher(ABC):
     """Port for password hashing operations."""
 
     @abstractmethod
-    def hash(self, password: Password) -> PasswordHash:
+    async def hash(self, password: Password) -> PasswordHash:
         """Hash a password and return the hash.
 
+        Hashing is CPU-bound: implementations must not block the event loop.
+
         Args:
             password: The password value object to hash
 
@@ -23,9 +25,11 @@ class PasswordHasher(ABC):
         ...
 
     @abstractmethod
-    def verify(self, password: Password, password_hash: PasswordHash) -> bool:
+    async def verify(self, password: Password, password_hash: PasswordHash) -> bool:
         """Verify a password against a hash.
 
+        Verification is CPU-bound: implementations must not block the event loop.
+
         Args:
             password: The password value object to verify
             password_hash: The hash to verify against
@@ -0,0 +1,17 @@
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Coroutine
+from typing import Any
+
+
+class TaskScheduler(ABC):
+    """Port for running work in the background, outside of the request lifecycle."""
+
+    @abstractmethod
+    def schedule(self, coroutine: Coroutine[Any, Any, None]) -> None:
+        """Schedule a coroutine to run without waiting for its completion.
+
+        Args:
+            coroutine: The coroutine to run in the background
+        """
+        ...
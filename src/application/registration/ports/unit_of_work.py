@@ -0,0 +1,38 @@
+from abc import ABC
+from abc import abstractmethod
+from types import TracebackType
+from typing import Self
+
+
+class UnitOfWork(ABC):
+    """Port for grouping repository writes into a single atomic transaction.
+
+    Usage:
+        async with unit_of_work:
+            ...  # writes are committed together, or rolled back on error
+    """
+
+    @abstractmethod
+    async def __aenter__(self) -> Self:
+        """Begin the unit of work.
+
+        Returns:
+            The unit of work itself
+        """
+        ...
+
+    @abstractmethod
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Commit the unit of work, or roll it back if an exception was raised.
+
+        Args:
+            exc_type: Type of the exception raised in the block, if any
+            exc: Exception raised in the block, if any
+            traceback: Traceback of the exception raised in the block, if any
+        """
+        ...
@@ -1,8 +1,6 @@
 from abc import ABC
 from abc import abstractmethod
 
-from pydantic import EmailStr
-
 from src.domain.user.entities.user import User
 from src.domain.user.entities.user import UserId
 from src.domain.user.entities.user import UserPublicId
@@ -14,7 +12,7 @@ class UserRepository(ABC):
     """Port for user persistence operations."""
 
     @abstractmethod
-    async def create(self, email: EmailStr, password_hash: PasswordHash) -> User:
+    async def create(self, email: str, password_hash: PasswordHash) -> User:
         """Create a new user.
 
         Args:
@@ -1,6 +1,7 @@
 from src.application.registration.ports.activation_code_repository import (
     ActivationCodeRepository,
 )
+from src.application.registration.ports.unit_of_work import UnitOfWork
 from src.application.registration.ports.user_repository import UserRepository
 from src.domain.user.entities.user import User
 from src.domain.user.entities.user import UserId
@@ -14,15 +15,18 @@ class ActivateUser:
         self,
         user_repository: UserRepository,
         activation_code_repository: ActivationCodeRepository,
+        unit_of_work: UnitOfWork,
     ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             user_repository: Repository for user persistence
             activation_code_repository: Repository for activation codes
+            unit_of_work: Unit of work making the activation writes atomic
         """
         self._user_repository = user_repository
         self._activation_code_repository = activation_code_repository
+        self._unit_of_work = unit_of_work
 
     async def execute(self, user_id: UserId, code: str) -> User:
         """Activate a user account with activation code.
@@ -39,7 +43,7 @@ class ActivateUser:
             ActivationCodeNotFoundError: If activation code not found
             ActivationCodeInvalidError: If activation code is invalid (wrong or expired)
         """
-        # Find and verify activation code
+        # Find the submitted activation code
         activation_code = (
             await self._activation_code_repository.find_by_user_id_and_code(
                 user_id, code
@@ -49,12 +53,16 @@ class ActivateUser:
         # Verify activation code validity (raises ActivationCodeInvalidError if invalid)
         activation_code.is_valid()
 
-        # Update user status to ACTIVE
-        activated_user = await self._user_repository.set_status(
-            user_id, UserStatus.ACTIVE
-        )
+        # Update user status to ACTIVE, then consume the code, in one transaction
+        # so a user is never activated with a still-pending code. Both writes stay
+        # sequential: the repositories share the request's database connection,
+        # and an asyncpg connection cannot run two queries concurrently.
+        async with self._unit_of_work:
+            activated_user = await self._user_repository.set_status(
+                user_id, UserStatus.ACTIVE
+            )
 
-        # Mark activation code as used (one-time use)
-        await self._activation_code_repository.mark_as_used(user_id)
+            # Mark activation code as used (one-time use)
+            await self._activation_code_repository.mark_as_used(user_id)
 
         return activated_user
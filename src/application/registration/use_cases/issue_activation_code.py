@@ -2,6 +2,7 @@ from src.application.registration.ports.activation_code_repository import (
     ActivationCodeRepository,
 )
 from src.application.registration.ports.email_service import EmailService
+from src.application.registration.ports.task_scheduler import TaskScheduler
 from src.application.registration.ports.user_repository import UserRepository
 from src.domain.user.entities.activation_code import ActivationCode
 from src.domain.user.entities.user import User
@@ -16,6 +17,7 @@ class IssueActivationCode:
         user_repository: UserRepository,
         activation_code_repository: ActivationCodeRepository,
         email_service: EmailService,
+        task_scheduler: TaskScheduler,
     ) -> None:
         """Initialize use case with dependencies.
 
@@ -23,10 +25,12 @@ class IssueActivationCode:
             user_repository: Repository for user persistence
             activation_code_repository: Repository for activation codes
             email_service: Service for sending emails
+            task_scheduler: Service for running work in the background
         """
         self._user_repository = user_repository
         self._activation_code_repository = activation_code_repository
         self._email_service = email_service
+        self._task_scheduler = task_scheduler
 
     async def execute(self, user_id: UserId) -> User:
         """Issue a new activation code for a user.
@@ -51,7 +55,10 @@ class IssueActivationCode:
         # Old codes will naturally expire, but for enhanced security, we could explicitly mark
         # old pending codes as a new status enum "unused" when issuing a new one to prevent any potential reuse.
 
-        # Send activation code via email
-        await self._email_service.send_activation_code(user.email, activation_code.code)
+        # Send activation code via email in the background: the caller does not need
+        # the delivery result, so the response is not held back by the email provider
+        self._task_scheduler.schedule(
+            self._email_service.send_activation_code(user.email, activation_code.code)
+        )
 
         return user
@@ -38,7 +38,7 @@ class RegisterUser:
         password_vo = Password(password)
 
         # Hash password
-        password_hash = self._password_hasher.hash(password_vo)
+        password_hash = await self._password_hasher.hash(password_vo)
 
         # Save user (repository creates user with generated public_id and PENDING status)
         user = await self._user_repository.create(email, password_hash)
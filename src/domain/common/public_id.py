@@ -1,6 +1,8 @@
 """Base PublicId value object for domain entities."""
 
+import re
 from dataclasses import dataclass
+from dataclasses import field
 from typing import ClassVar
 from typing import TypeVar
 from uuid import UUID
@@ -8,14 +10,21 @@ from uuid import uuid7
 
 T = TypeVar("T", bound="PublicId")
 
+# 'prefix_uuid' with the UUID in its canonical 8-4-4-4-12 hyphenated form
+_PUBLIC_ID_PATTERN = re.compile(
+    r"([a-z]+)_([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})"
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PublicId:
     """Base class for public identifiers combining a prefix with UUIDv7."""
 
     PREFIX: ClassVar[str]  # Subclasses must define this
     prefix: str
     uuid_v7: UUID
+    # String form computed once: public IDs are rendered in every API response
+    _str: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate that prefix matches the expected value."""
@@ -23,25 +32,52 @@ class PublicId:
             raise ValueError(
                 f"Invalid prefix: expected '{self.PREFIX}', got '{self.prefix}'"
             )
+        object.__setattr__(self, "_str", f"{self.prefix}_{self.uuid_v7}")
+
+    @classmethod
+    def _unchecked(cls: type[T], uuid_v7: UUID) -> T:
+        """Build a PublicId with the class prefix, skipping `__init__` validation.
+
+        Only for callers that already guarantee the prefix (generation, parsing,
+        stored UUIDs).
+        """
+        public_id = cls.__new__(cls)
+        object.__setattr__(public_id, "prefix", cls.PREFIX)
+        object.__setattr__(public_id, "uuid_v7", uuid_v7)
+        object.__setattr__(public_id, "_str", f"{cls.PREFIX}_{uuid_v7}")
+        return public_id
+
+    @classmethod
+    def from_uuid(cls: type[T], uuid_v7: UUID) -> T:
+        """Build a PublicId from its UUID, with the class prefix (e.g. stored ids)."""
+        return cls._unchecked(uuid_v7)
 
     @classmethod
     def generate(cls: type[T]) -> T:
         """Generate a new PublicId with a fresh UUIDv7."""
-        return cls(cls.PREFIX, uuid7())
+        return cls._unchecked(uuid7())
 
     @classmethod
     def from_string(cls: type[T], value: str) -> T:
         """Parse PublicId from string format 'prefix_uuid'."""
         try:
-            prefix, uuid_str = value.split("_", 1)
-            uuid_v7 = UUID(uuid_str)
-            return cls(prefix=prefix, uuid_v7=uuid_v7)
-        except (ValueError, AttributeError) as e:
+            match = _PUBLIC_ID_PATTERN.fullmatch(value)
+            if match is None:
+                raise ValueError("Expected 'prefix_uuid' with a canonical UUID")
+            prefix, uuid_str = match.groups()
+            if prefix != cls.PREFIX:
+                raise ValueError(
+                    f"Invalid prefix: expected '{cls.PREFIX}', got '{prefix}'"
+                )
+            # The pattern guarantees 32 hex digits: build the UUID from its integer
+            # value instead of going through UUID's string parsing
+            return cls._unchecked(UUID(int=int(uuid_str.replace("-", ""), 16)))
+        except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid {cls.__name__} format: {value}") from e
 
     def __str__(self) -> str:
         """Return string representation: 'prefix_uuid'."""
-        return f"{self.prefix}_{self.uuid_v7}"
+        return self._str
 
     def __repr__(self) -> str:
         """Return representation."""
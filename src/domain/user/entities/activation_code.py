@@ -1,13 +1,12 @@
-import random
+import secrets
+import time
+from dataclasses import dataclass
+from dataclasses import field
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
 from enum import StrEnum
 
-from pydantic import BaseModel
-from pydantic import ConfigDict
-from pydantic import Field
-
 from src.domain.user.entities.user import UserId
 from src.domain.user.errors import ActivationCodeInvalidError
 
@@ -21,22 +20,43 @@ class ActivationCodeStatus(StrEnum):
 
 # Constants
 ACTIVATION_CODE_LENGTH = 4
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+# Every well-formed code ("0000" to "9999"), so validation is one set lookup
+_VALID_CODES = frozenset(
+    f"{i:0{ACTIVATION_CODE_LENGTH}d}" for i in range(10**ACTIVATION_CODE_LENGTH)
+)
 
 
-class ActivationCode(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ActivationCode:
     """Activation code entity for user account activation."""
 
-    model_config = ConfigDict(frozen=True, extra="forbid")
-
     user_id: UserId
-    code: str = Field(
-        ...,
-        description="4-digit activation code",
-        min_length=ACTIVATION_CODE_LENGTH,
-        max_length=ACTIVATION_CODE_LENGTH,
-    )
+    code: str  # 4-digit activation code
     expires_at: datetime
     status: ActivationCodeStatus = ActivationCodeStatus.PENDING
+    # Expiration as Unix epoch nanoseconds, so expiration checks are integer comparisons
+    _expires_at_ns: int = field(init=False, repr=False, compare=False)
+    # Status is fixed for the lifetime of the (frozen) entity
+    _is_used: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Validate the code length and derive the epoch expiration and used flag.
+
+        Raises:
+            ValueError: If code is not exactly 4 characters long
+        """
+        if len(self.code) != ACTIVATION_CODE_LENGTH:
+            raise ValueError(
+                f"Activation code must be exactly {ACTIVATION_CODE_LENGTH} characters"
+            )
+        object.__setattr__(
+            self,
+            "_expires_at_ns",
+            (self.expires_at - _EPOCH) // _ONE_MICROSECOND * 1_000,
+        )
+        object.__setattr__(self, "_is_used", self.status == ActivationCodeStatus.USED)
 
     @staticmethod
     def validate_code_format(code: str) -> str:
@@ -51,7 +71,12 @@ class ActivationCode(BaseModel):
         Raises:
             ValueError: If code is not 4 digits
         """
-        if not code.isdigit():
+        if code in _VALID_CODES:
+            return code
+
+        # Invalid code: work out which rule it breaks (ASCII digits only, as
+        # isdigit() alone would accept other scripts' digits)
+        if not (code.isascii() and code.isdigit()):
             raise ValueError("Activation code must contain only digits")
         if len(code) != ACTIVATION_CODE_LENGTH:
             raise ValueError(
@@ -63,10 +88,12 @@ class ActivationCode(BaseModel):
     def generate_code() -> str:
         """Generate a 4-digit activation code.
 
+        Uses a CSPRNG: activation codes are one-time passwords and must not be predictable.
+
         Returns:
             4-digit code as string (zero-padded)
         """
-        return f"{random.randint(0, 9999):04d}"  # noqa: S311 - Random is acceptable for activation codes
+        return f"{secrets.randbelow(10_000):04d}"
 
     @classmethod
     def create(
@@ -84,12 +111,14 @@ class ActivationCode(BaseModel):
             New ActivationCode instance
         """
         code = cls.generate_code()
-        expires_at = datetime.now(UTC) + timedelta(minutes=expires_in_minutes)
+        # One clock read and one datetime, instead of now() plus timedelta arithmetic
+        expires_at = datetime.fromtimestamp(time.time() + expires_in_minutes * 60, UTC)
 
         return cls(
             user_id=user_id,
             code=code,
             expires_at=expires_at,
+            status=ActivationCodeStatus.PENDING,
         )
 
     def is_expired(self) -> bool:
@@ -98,7 +127,7 @@ class ActivationCode(BaseModel):
         Returns:
             True if code is expired, False otherwise
         """
-        return datetime.now(UTC) >= self.expires_at
+        return time.time_ns() >= self._expires_at_ns
 
     def is_used(self) -> bool:
         """Check if the activation code has been used.
@@ -106,7 +135,7 @@ class ActivationCode(BaseModel):
         Returns:
             True if code is used, False otherwise
         """
-        return self.status == ActivationCodeStatus.USED
+        return self._is_used
 
     def is_valid(self) -> bool:
         """Check if the activation code is valid (not expired and not used).
@@ -117,12 +146,14 @@ class ActivationCode(BaseModel):
         Raises:
             ActivationCodeInvalidError: If code is expired or already used
         """
-        if self.is_used():
-            raise ActivationCodeInvalidError("Activation code has already been used.")
-
+        # Expiration is checked first: with a short TTL it is by far the most
+        # common failure, and it is a single integer comparison
         if self.is_expired():
             raise ActivationCodeInvalidError(
                 "Activation code has expired. Please request a new activation code."
             )
 
+        if self.is_used():
+            raise ActivationCodeInvalidError("Activation code has already been used.")
+
         return True
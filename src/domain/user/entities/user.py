@@ -1,11 +1,8 @@
+from dataclasses import dataclass
 from enum import StrEnum
 from typing import ClassVar
 from typing import NewType
 
-from pydantic import BaseModel
-from pydantic import ConfigDict
-from pydantic import EmailStr
-
 from src.domain.common.public_id import PublicId
 from src.domain.user.value_objects.password_hash import PasswordHash
 
@@ -20,14 +17,22 @@ class UserStatus(StrEnum):
 class UserPublicId(PublicId):
     """Public identifier for a user."""
 
+    __slots__ = ()
+
     PREFIX: ClassVar[str] = "usr"
 
 
-class User(BaseModel):
-    model_config = ConfigDict(frozen=True, extra="forbid")
+@dataclass(frozen=True, slots=True)
+class User:
+    """User entity.
+
+    Built from already-validated data (request schemas, database rows), so it
+    carries no validation of its own: the email is checked once at the HTTP
+    boundary.
+    """
 
     id: UserId
     public_id: UserPublicId
-    email: EmailStr
+    email: str
     password_hash: PasswordHash
     status: UserStatus
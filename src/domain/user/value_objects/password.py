@@ -1,8 +1,49 @@
-import re
+import string
 from dataclasses import dataclass
 
+# Character class flags
+_UPPERCASE = 0b0001
+_LOWERCASE = 0b0010
+_DIGIT = 0b0100
+_SPECIAL_CHAR = 0b1000
 
-@dataclass(frozen=True)
+# Validation failure flags (a missing character class reuses its class flag)
+_TOO_SHORT = 0b010000
+_TOO_LONG = 0b100000
+
+_SPECIAL_CHARS = "!@#$%^&*()_+-=[]{};':\"\\|,.<>/?"
+
+# Fixed error messages for missing character classes, in reporting order
+_CLASS_FAILURE_MESSAGES = (
+    (_UPPERCASE, "Password must contain at least one uppercase letter"),
+    (_LOWERCASE, "Password must contain at least one lowercase letter"),
+    (_DIGIT, "Password must contain at least one digit"),
+    (_SPECIAL_CHAR, "Password must contain at least one special character"),
+)
+
+
+def _build_class_table() -> bytes:
+    """Build a byte -> character class flags lookup table.
+
+    Returns:
+        256-entry table; non-ASCII bytes map to no class
+    """
+    table = bytearray(256)
+    for char in string.ascii_uppercase:
+        table[ord(char)] |= _UPPERCASE
+    for char in string.ascii_lowercase:
+        table[ord(char)] |= _LOWERCASE
+    for char in string.digits:
+        table[ord(char)] |= _DIGIT
+    for char in _SPECIAL_CHARS:
+        table[ord(char)] |= _SPECIAL_CHAR
+    return bytes(table)
+
+
+_CLASS_TABLE = _build_class_table()
+
+
+@dataclass(frozen=True, slots=True)
 class Password:
     """Password value object that validates password strength requirements."""
 
@@ -17,35 +58,83 @@ class Password:
 
     def __post_init__(self) -> None:
         """Validate password strength requirements."""
-        errors: list[str] = []
-
-        if len(self.value) < self.MIN_LENGTH:
-            errors.append(
-                f"Password must be at least {self.MIN_LENGTH} characters long"
-            )
+        length = len(self.value)
 
-        if len(self.value) > self.MAX_LENGTH:
-            errors.append(f"Password must be at most {self.MAX_LENGTH} characters long")
+        # Reject oversized input before scanning it, so arbitrarily long
+        # submissions cost no more than a length check
+        if length > self.MAX_LENGTH:
+            raise self._validation_error(_TOO_LONG)
 
-        if self.REQUIRES_UPPERCASE and not re.search(r"[A-Z]", self.value):
-            errors.append("Password must contain at least one uppercase letter")
+        failures = 0
 
-        if self.REQUIRES_LOWERCASE and not re.search(r"[a-z]", self.value):
-            errors.append("Password must contain at least one lowercase letter")
+        if length < self.MIN_LENGTH:
+            failures |= _TOO_SHORT
 
-        if self.REQUIRES_DIGIT and not re.search(r"\d", self.value):
-            errors.append("Password must contain at least one digit")
+        # Classify characters without a per-character Python loop: translate maps
+        # every byte to its class flags in C, and the set keeps at most 16 distinct
+        # flag values to combine (non-ASCII bytes belong to no class)
+        seen = 0
+        for flags in set(
+            self.value.encode("utf-8", "surrogatepass").translate(_CLASS_TABLE)
+        ):
+            seen |= flags
 
-        if self.REQUIRES_SPECIAL_CHAR and not re.search(
-            r"[!@#$%^&*()_+\-=\[\]{};':\"\\|,.<>\/?]", self.value
+        # Digits also include non-ASCII decimal digits (as matched by \d)
+        if (
+            not seen & _DIGIT
+            and not self.value.isascii()
+            and any(char.isdecimal() for char in self.value)
         ):
-            errors.append("Password must contain at least one special character")
+            seen |= _DIGIT
+
+        if self.REQUIRES_UPPERCASE and not seen & _UPPERCASE:
+            failures |= _UPPERCASE
+
+        if self.REQUIRES_LOWERCASE and not seen & _LOWERCASE:
+            failures |= _LOWERCASE
+
+        if self.REQUIRES_DIGIT and not seen & _DIGIT:
+            failures |= _DIGIT
+
+        if self.REQUIRES_SPECIAL_CHAR and not seen & _SPECIAL_CHAR:
+            failures |= _SPECIAL_CHAR
+
+        if failures:
+            raise self._validation_error(failures)
 
-        if errors:
-            raise ExceptionGroup(
-                "Password validation failed",
-                [ValueError(error) for error in errors],
+    def _validation_error(self, failures: int) -> ExceptionGroup[ValueError]:
+        """Build the validation error for the given failures.
+
+        Error messages and exceptions are only built when validation fails.
+        Fresh ValueError instances are created on every call, since raising
+        an exception attaches its traceback to that instance.
+
+        Args:
+            failures: Bitmask of validation failure flags
+
+        Returns:
+            ExceptionGroup with one ValueError per failure, in reporting order
+        """
+        errors: list[ValueError] = []
+        # Length messages depend on the (overridable) length limits
+        if failures & _TOO_SHORT:
+            errors.append(
+                ValueError(
+                    f"Password must be at least {self.MIN_LENGTH} characters long"
+                )
+            )
+        if failures & _TOO_LONG:
+            errors.append(
+                ValueError(
+                    f"Password must be at most {self.MAX_LENGTH} characters long"
+                )
             )
+        errors.extend(
+            ValueError(message)
+            for failure, message in _CLASS_FAILURE_MESSAGES
+            if failures & failure
+        )
+        return ExceptionGroup("Password validation failed", errors)
 
     def __str__(self) -> str:
         """Return masked password for security."""
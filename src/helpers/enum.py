@@ -1,3 +1,4 @@
+import json
 from enum import Enum
 from enum import StrEnum
 from typing import TypeVar
@@ -6,6 +7,28 @@ from typing import TypeVar
 class EnumHelper:
     TEnum = TypeVar("TEnum", bound=Enum)
 
+    @staticmethod
+    def _combine(*enums: type[TEnum]) -> tuple[type[Enum], dict[str, str | int]]:
+        """
+        Combines the members of multiple enums.
+
+        Args:
+            *enums: The enums to combine.
+
+        Returns:
+            The enum type to build (StrEnum if all inputs are StrEnum, else Enum)
+            and the combined member names and values.
+        """
+        enum_type = (
+            StrEnum if all(issubclass(enum, StrEnum) for enum in enums) else Enum
+        )
+        combined_dict: dict[str, str | int] = {
+            key: member.value
+            for enum in enums
+            for key, member in enum.__members__.items()
+        }
+        return enum_type, combined_dict
+
     @staticmethod
     def merge(name: str, *enums: type[TEnum]) -> Enum | StrEnum:
         """
@@ -19,12 +42,33 @@ class EnumHelper:
         Returns:
             A new enum class that combines all input enums.
         """
-        combined_dict: dict[str, str | int] = {}
-        enum_type = (
-            StrEnum if all(issubclass(enum, StrEnum) for enum in enums) else Enum
-        )
+        enum_type, combined_dict = EnumHelper._combine(*enums)
+        return enum_type(name, combined_dict)
 
-        for enum in enums:
-            combined_dict.update({k: v.value for k, v in enum.__members__.items()})
+    @staticmethod
+    def merge_to_source(name: str, *enums: type[TEnum]) -> str:
+        """
+        Renders the merge of multiple enums as Python source code.
 
-        return enum_type(name, combined_dict)
+        The generated module defines the merged enum with a plain class statement,
+        so importing it skips the merge entirely.
+
+        Args:
+            *enums: The enums to merge.
+            name: The name for the combined enum.
+
+        Returns:
+            Python module source defining the merged enum.
+        """
+        enum_type, combined_dict = EnumHelper._combine(*enums)
+        lines = [
+            f"from enum import {enum_type.__name__}",
+            "",
+            "",
+            f"class {name}({enum_type.__name__}):",
+        ]
+        # JSON literals are valid Python for str/int values, and double-quoted
+        lines.extend(
+            f"    {key} = {json.dumps(value)}" for key, value in combined_dict.items()
+        )
+        return "\n".join(lines) + "\n"
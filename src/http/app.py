@@ -1,5 +1,4 @@
 from contextlib import asynccontextmanager
-from types import SimpleNamespace
 
 from asyncpg import PostgresError
 from fastapi import FastAPI
@@ -9,6 +8,8 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import ORJSONResponse
 
 from src.domain.user.errors import UserError
+from src.http.dependencies.services import Services
+from src.http.dependencies.services import bind_services
 from src.http.error_management.error_handlers import base_exception_handler
 from src.http.error_management.error_handlers import exception_group_handler
 from src.http.error_management.error_handlers import http_exception_handler
@@ -21,6 +22,7 @@ from src.infrastructure.database.postgres.asyncpg_pool import close_db_pool
 from src.infrastructure.database.postgres.asyncpg_pool import initialize_db_pool
 from src.infrastructure.security.password_hasher import BcryptPasswordHasher
 from src.infrastructure.smtp.email_service import LoggerEmailService
+from src.infrastructure.tasks.task_scheduler import AsyncioTaskScheduler
 
 """
 # FastAPI App
@@ -37,14 +39,19 @@ async def lifespan(fastapi_app: FastAPI):
     )
 
     # Initialize services once
-    fastapi_app.state.services = SimpleNamespace(
-        password_hasher=BcryptPasswordHasher(),
-        email_service=LoggerEmailService(),
+    task_scheduler = AsyncioTaskScheduler()
+    bind_services(
+        Services(
+            password_hasher=BcryptPasswordHasher(),
+            email_service=LoggerEmailService(),
+            task_scheduler=task_scheduler,
+        )
     )
 
     yield  # App Running
 
     # App Shutdown
+    await task_scheduler.wait_for_pending()  # Let background tasks (e.g. emails) finish
     await close_db_pool()
 
 
@@ -71,7 +78,10 @@ app = FastAPI(
 The order of middleware execution in FastAPI follows a "first in, last out" (FILO) approach.
 This means that the first middleware registered will be the last one to execute, and the last middleware registered will be the first one to execute.
 """
-app.add_middleware(LoggingMiddleware)
+app.add_middleware(
+    LoggingMiddleware,
+    skip_paths=frozenset({"/v1/healthcheck"}),  # Probes would flood the logs
+)
 app.add_middleware(
     GZipMiddleware,
     minimum_size=500,  # Compress responses larger than 500 bytes
@@ -1,7 +1,6 @@
 """Authentication dependencies for FastAPI endpoints."""
 
 from fastapi import HTTPException
-from fastapi import Request
 from fastapi import Security
 from fastapi import status
 from fastapi.security import HTTPBasic
@@ -11,6 +10,7 @@ from src.domain.user.entities.user import User
 from src.domain.user.errors import UserNotFoundError
 from src.domain.user.value_objects.password import Password
 from src.http.dependencies.database_asyncpg import DbConnection
+from src.http.dependencies.services import get_services
 from src.infrastructure.database.postgres.repositories.user_repository import (
     PostgresUserRepository,
 )
@@ -21,7 +21,6 @@ security_scheme = HTTPBasic()
 
 async def get_authenticated_user_from_basic_auth(
     credentials: HTTPBasicCredentials = Security(security_scheme),
-    request: Request = None,  # type: ignore[assignment]
     conn: DbConnection = None,  # type: ignore[assignment]
 ) -> User:
     """Extract and validate user credentials from Basic Auth (email:password).
@@ -31,7 +30,6 @@ async def get_authenticated_user_from_basic_auth(
 
     Args:
         credentials: HTTP Basic Auth credentials from Authorization header
-        request: FastAPI request object to access app state (injected via dependency)
         conn: Database connection from the pool (injected via dependency)
 
     Returns:
@@ -52,7 +50,7 @@ async def get_authenticated_user_from_basic_auth(
 
     # Get user repository and password hasher
     user_repository = PostgresUserRepository(conn)
-    password_hasher = request.app.state.services.password_hasher
+    password_hasher = get_services().password_hasher
 
     try:
         # Find user by email
@@ -67,7 +65,7 @@ async def get_authenticated_user_from_basic_auth(
     # Verify password
     try:
         password_vo = Password(password)
-        is_valid = password_hasher.verify(password_vo, user.password_hash)
+        is_valid = await password_hasher.verify(password_vo, user.password_hash)
     except (ValueError, ExceptionGroup):
         # Password validation failed (invalid format)
         raise HTTPException(
@@ -34,8 +34,12 @@ async def get_db_connection(
             return users
     """
     pool: asyncpg.Pool = request.app.state.db_pool.pool
-    async with pool.acquire() as connection:
+    # Acquire and release directly rather than through the acquire context manager
+    connection = await pool.acquire()
+    try:
         yield connection
+    finally:
+        await pool.release(connection)
 
 
 # Type alias for easier use in route handlers
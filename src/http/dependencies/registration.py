@@ -1,34 +1,33 @@
-from fastapi import Request
-
 from src.application.registration.use_cases.activate_user import ActivateUser
 from src.application.registration.use_cases.issue_activation_code import (
     IssueActivationCode,
 )
 from src.application.registration.use_cases.register_user import RegisterUser
 from src.http.dependencies.database_asyncpg import DbConnection
+from src.http.dependencies.services import get_services
 from src.infrastructure.database.postgres.repositories.activation_code_repository import (
     PostgresActivationCodeRepository,
 )
 from src.infrastructure.database.postgres.repositories.user_repository import (
     PostgresUserRepository,
 )
+from src.infrastructure.database.postgres.unit_of_work import PostgresUnitOfWork
 
 
-def get_register_user_use_case(
-    request: Request,
+async def get_register_user_use_case(
     conn: DbConnection,
 ) -> RegisterUser:
     """Dependency to create RegisterUser use case with all dependencies.
 
     Args:
-        request: FastAPI request object to access app state
         conn: Database connection from the pool
 
     Returns:
         RegisterUser use case instance
     """
+    services = get_services()
     user_repository = PostgresUserRepository(conn)
-    password_hasher = request.app.state.services.password_hasher
+    password_hasher = services.password_hasher
 
     return RegisterUser(
         user_repository=user_repository,
@@ -36,14 +35,12 @@ def get_register_user_use_case(
     )
 
 
-def get_activate_user_use_case(
-    request: Request,
+async def get_activate_user_use_case(
     conn: DbConnection,
 ) -> ActivateUser:
     """Dependency to create ActivateUser use case with all dependencies.
 
     Args:
-        request: FastAPI request object to access app state
         conn: Database connection from the pool
 
     Returns:
@@ -51,32 +48,35 @@ def get_activate_user_use_case(
     """
     user_repository = PostgresUserRepository(conn)
     activation_code_repository = PostgresActivationCodeRepository(conn)
+    unit_of_work = PostgresUnitOfWork(conn)
 
     return ActivateUser(
         user_repository=user_repository,
         activation_code_repository=activation_code_repository,
+        unit_of_work=unit_of_work,
     )
 
 
-def get_issue_activation_code_use_case(
-    request: Request,
+async def get_issue_activation_code_use_case(
     conn: DbConnection,
 ) -> IssueActivationCode:
     """Dependency to create IssueActivationCode use case with all dependencies.
 
     Args:
-        request: FastAPI request object to access app state
         conn: Database connection from the pool
 
     Returns:
         IssueActivationCode use case instance
     """
+    services = get_services()
     user_repository = PostgresUserRepository(conn)
     activation_code_repository = PostgresActivationCodeRepository(conn)
-    email_service = request.app.state.services.email_service
+    email_service = services.email_service
+    task_scheduler = services.task_scheduler
 
     return IssueActivationCode(
         user_repository=user_repository,
         activation_code_repository=activation_code_repository,
         email_service=email_service,
+        task_scheduler=task_scheduler,
     )
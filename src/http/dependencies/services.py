@@ -0,0 +1,50 @@
+"""Application services shared by FastAPI dependencies.
+
+Services are created once during the app lifespan and bound here, so that
+dependencies read them from this module instead of walking
+`request.app.state.services` (and requiring the request) on every request.
+"""
+
+from dataclasses import dataclass
+
+from src.application.registration.ports.email_service import EmailService
+from src.application.registration.ports.password_hasher import PasswordHasher
+from src.application.registration.ports.task_scheduler import TaskScheduler
+
+
+@dataclass(frozen=True, slots=True)
+class Services:
+    """Application-wide services, created once at startup."""
+
+    password_hasher: PasswordHasher
+    email_service: EmailService
+    task_scheduler: TaskScheduler
+
+
+_services: Services | None = None
+
+
+def bind_services(services: Services) -> None:
+    """Bind the application services for use by dependencies.
+
+    Args:
+        services: Services created during the app lifespan
+    """
+    global _services  # noqa: PLW0603 - Bound once at startup, read-only afterwards
+    _services = services
+
+
+def get_services() -> Services:
+    """Get the application services.
+
+    Returns:
+        Services bound during the app lifespan
+
+    Raises:
+        RuntimeError: If services have not been bound
+    """
+    if _services is None:
+        raise RuntimeError(
+            "Services have not been bound. Call bind_services() at app startup."
+        )
+    return _services
@@ -1,3 +0,0 @@
-from src.http.error_management.error_code import ErrorCode
-
-__all__ = ["ErrorCode"]
@@ -1,15 +1,13 @@
 from fastapi import Request
+from fastapi import Response
 from fastapi import status
-from fastapi.responses import JSONResponse
 
 from src.http.error_management.error_code import HttpErrorCode
 from src.http.error_management.error_utils import extract_exceptions
 from src.http.error_management.error_utils import format_error_response
 
 
-async def base_exception_handler(
-    request: Request, exception: Exception
-) -> JSONResponse:
+async def base_exception_handler(request: Request, exception: Exception) -> Response:
     return format_error_response(
         request=request,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -21,7 +19,7 @@ async def base_exception_handler(
 
 async def exception_group_handler(
     request: Request, exception_group: ExceptionGroup[Exception]
-) -> JSONResponse:
+) -> Response:
     return format_error_response(
         request=request,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,18 +1,24 @@
 from fastapi import HTTPException
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi import Response
 
 from src.http.error_management.error_code import HttpErrorCode
 from src.http.error_management.error_utils import format_error_response
 
+# Error code by HTTP status code, so handling an error is a single int lookup
+_CODE_BY_STATUS: dict[int, HttpErrorCode] = {
+    int(name.removeprefix("HTTP_")): member
+    for name, member in HttpErrorCode.__members__.items()
+}
+
 
 async def http_exception_handler(
     request: Request, exception: HTTPException
-) -> JSONResponse:
+) -> Response:
     return format_error_response(
         request=request,
         status_code=exception.status_code,
-        error_code=HttpErrorCode[f"HTTP_{exception.status_code}"],
+        error_code=_CODE_BY_STATUS[exception.status_code],
         message=exception.detail,
         exceptions=[exception],
         log_as="exception" if exception.status_code >= 500 else "warning",  # noqa: PLR2004
@@ -1,6 +1,6 @@
 from fastapi import Request
+from fastapi import Response
 from fastapi import status
-from fastapi.responses import JSONResponse
 
 from src.domain.user.errors import ActivationCodeInvalidError
 from src.domain.user.errors import ActivationCodeNotFoundError
@@ -9,31 +9,42 @@ from src.domain.user.errors import UserError
 from src.domain.user.errors import UserNotFoundError
 from src.http.error_management.error_utils import format_error_response
 
+# HTTP status code by user exception type
+_STATUS_BY_EXCEPTION: dict[type[UserError], int] = {
+    UserNotFoundError: status.HTTP_404_NOT_FOUND,
+    UserAlreadyExistsError: status.HTTP_409_CONFLICT,
+    ActivationCodeNotFoundError: status.HTTP_404_NOT_FOUND,
+    ActivationCodeInvalidError: status.HTTP_400_BAD_REQUEST,
+}
 
-async def user_exception_handler(
-    request: Request, exception: UserError
-) -> JSONResponse:
+
+def _status_code_for(exception: UserError) -> int:
+    """Get the HTTP status code for a user exception.
+
+    Walks the exception's class hierarchy, so subclasses of a mapped exception
+    get its status code.
+
+    Args:
+        exception: The user exception.
+
+    Returns:
+        The status code of the closest mapped class, or 400 for base UserError.
+    """
+    for exception_type in type(exception).__mro__:
+        status_code = _STATUS_BY_EXCEPTION.get(exception_type)
+        if status_code is not None:
+            return status_code
+    return status.HTTP_400_BAD_REQUEST
+
+
+async def user_exception_handler(request: Request, exception: UserError) -> Response:
     """
     Handler for user-related exceptions.
     Maps user exceptions to appropriate HTTP status codes.
     """
-    # Determine status code based on exception type
-    match exception:
-        case UserNotFoundError():
-            status_code = status.HTTP_404_NOT_FOUND
-        case UserAlreadyExistsError():
-            status_code = status.HTTP_409_CONFLICT
-        case ActivationCodeNotFoundError():
-            status_code = status.HTTP_404_NOT_FOUND
-        case ActivationCodeInvalidError():
-            status_code = status.HTTP_400_BAD_REQUEST
-        case _:
-            # Default to 400 for base UserError
-            status_code = status.HTTP_400_BAD_REQUEST
-
     return format_error_response(
         request=request,
-        status_code=status_code,
+        status_code=_status_code_for(exception),
         error_code=exception.error_code,
         message=exception.message,
         exceptions=[exception],
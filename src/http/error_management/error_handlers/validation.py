@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from fastapi import Request
 from fastapi import status
 from fastapi.exceptions import RequestValidationError
@@ -7,6 +9,15 @@ from src.http.error_management.error_response import ErrorResponseException
 from src.http.error_management.error_utils import format_error_response
 
 
+@lru_cache(maxsize=256)
+def _to_pascal_case(error_type: str) -> str:
+    """Convert a Pydantic error type (e.g. "string_too_short") to PascalCase.
+
+    Error types come from a small, closed set, so conversions are memoized.
+    """
+    return "".join(map(str.capitalize, error_type.split("_")))
+
+
 async def validation_exception_handler(
     request: Request, exception: RequestValidationError
 ):
@@ -15,9 +26,10 @@ async def validation_exception_handler(
         status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
         error_code=HttpErrorCode.HTTP_422,
         message="Validation Error",
+        # Built from Pydantic's own error entries: skip revalidating them
         exceptions=[
-            ErrorResponseException(
-                type="".join(map(str.capitalize, error["type"].split("_"))),
+            ErrorResponseException.model_construct(
+                type=_to_pascal_case(error["type"]),
                 message=(
                     f"{error['loc']}: {error['msg']}"
                     + (f" value={error['input']}" if error["input"] else "")
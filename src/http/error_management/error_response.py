@@ -6,14 +6,26 @@ from src.http.error_management.error_code import ErrorCode
 
 
 class ErrorResponseException(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel)
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+        frozen=True,
+        extra="forbid",
+        revalidate_instances="never",
+    )
 
     type: str
     message: str
 
 
 class ErrorResponseDetails(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel)
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+        frozen=True,
+        extra="forbid",
+        revalidate_instances="never",
+    )
 
     timestamp: str
     path: str
@@ -22,9 +34,15 @@ class ErrorResponseDetails(BaseModel):
 
 
 class ErrorResponse(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel)
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+        frozen=True,
+        extra="forbid",
+        revalidate_instances="never",
+    )
 
     status: int
-    code: ErrorCode  # type: ignore [reportInvalidTypeForm] Know issue since we are using `src.helpers.enum.EnumHelper.merge` to dynamically create the enum
+    code: ErrorCode
     message: str
     details: ErrorResponseDetails
@@ -1,17 +1,92 @@
 import datetime
+import logging
+from collections.abc import Iterator
 from enum import StrEnum
+from functools import cache
 from typing import Literal
+from typing import cast
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi import Response
 
+from src.http.error_management.error_code import ErrorCode
 from src.http.error_management.error_response import ErrorResponse
 from src.http.error_management.error_response import ErrorResponseDetails
 from src.http.error_management.error_response import ErrorResponseException
 from src.infrastructure.logging import getLogger
+from src.infrastructure.logging.api_call_context import ApiCallRequestContext
+from src.infrastructure.logging.api_call_context import RedactedHeaders
+from src.infrastructure.logging.api_call_context import get_request_id
 
 logger = getLogger(__name__, prefix="ErrorHandler")
 
+LogAs = Literal["exception", "error", "warning", "info", "debug"]
+
+# Logging level for each log_as value ("exception" also logs the traceback)
+_LOG_LEVELS: dict[LogAs, int] = {
+    "exception": logging.ERROR,
+    "error": logging.ERROR,
+    "warning": logging.WARNING,
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
+}
+
+
+@cache
+def _to_error_code(error_code: StrEnum) -> ErrorCode:
+    """Return the ErrorCode member for a source error code (HTTP, user, database).
+
+    Error codes form a small, closed set, so conversions are memoized.
+    """
+    return ErrorCode(error_code.value)
+
+
+def _get_request_context(request: Request) -> ApiCallRequestContext:
+    """Return the request context set by the logging middleware.
+
+    Requests on paths the middleware skips have none, so it is built on demand.
+
+    Args:
+        request: The request being handled.
+
+    Returns:
+        The request context.
+    """
+    try:
+        return request.state.request_context
+    except AttributeError:
+        return ApiCallRequestContext(
+            method=request.method,
+            url_path=request.url.path,
+            request_headers=RedactedHeaders(request.scope["headers"]),
+            request_id=get_request_id(request.headers.get("dailymotion-request-id")),
+        )
+
+
+def _to_response_exceptions(
+    exceptions: list[Exception] | list[ErrorResponseException],
+) -> list[ErrorResponseException]:
+    """Convert exceptions to response exception details, in a single pass.
+
+    Args:
+        exceptions: Raised exceptions, or already-built exception details.
+
+    Returns:
+        The exception details, in input order.
+    """
+    response_exceptions: list[ErrorResponseException] = []
+    append = response_exceptions.append
+    for exception in exceptions:
+        if isinstance(exception, ErrorResponseException):
+            append(exception)
+        else:
+            append(
+                ErrorResponseException.model_construct(
+                    type=type(exception).__name__, message=str(exception)
+                )
+            )
+    return response_exceptions
+
 
 def format_error_response(  # noqa: PLR0913
     status_code: int,
@@ -20,70 +95,68 @@ def format_error_response(  # noqa: PLR0913
     request: Request,
     exceptions: list[Exception] | list[ErrorResponseException],
     headers: dict[str, str] | None = None,
-    log_as: Literal["exception", "error", "warning", "info", "debug"] = "exception",
-):
-    error_response = ErrorResponse(
+    log_as: LogAs = "exception",
+) -> Response:
+    # Error responses are built from handler-controlled values only:
+    # construct them without running Pydantic validation
+    request_context = _get_request_context(request)
+    error_response = ErrorResponse.model_construct(
         status=status_code,
-        code=error_code,
+        code=_to_error_code(error_code),
         message=message,
-        details=ErrorResponseDetails(
+        details=ErrorResponseDetails.model_construct(
             timestamp=datetime.datetime.now(datetime.UTC).isoformat(),
-            path=request.state.request_context.url_path,
-            request_id=str(request.state.request_context.request_id),
-            exceptions=[
-                ErrorResponseException(
-                    type=exception.__class__.__name__, message=str(exception)
-                )
-                for exception in exceptions
-                if isinstance(exception, Exception)
-            ]
-            + [
-                exception
-                for exception in exceptions
-                if isinstance(exception, ErrorResponseException)
-            ],
+            path=request_context.url_path,
+            request_id=request_context.request_id,
+            exceptions=_to_response_exceptions(exceptions),
         ),
-    ).model_dump()
+    )
 
-    match log_as:
-        case "exception":
-            logger.exception(
-                f"{status_code} {error_code.name} {message}",
-                extra={"error_response": error_response},
-            )
-        case "error":
-            logger.error(
-                f"{status_code} {error_code.name} {message}",
-                extra={"error_response": error_response},
-            )
-        case "warning":
-            logger.warning(
-                f"{status_code} {error_code.name} {message}",
-                extra={"error_response": error_response},
-            )
-        case "info":
-            logger.info(
-                f"{status_code} {error_code.name} {message}",
-                extra={"error_response": error_response},
-            )
-        case "debug":
-            logger.debug(
-                f"{status_code} {error_code.name} {message}",
-                extra={"error_response": error_response},
-            )
+    # Lazy %-style arguments: the message is only formatted if the level is enabled
+    logger.log(
+        _LOG_LEVELS[log_as],
+        "%d %s %s",
+        status_code,
+        error_code.name,
+        message,
+        exc_info=log_as == "exception",
+        extra={"error_response": error_response},
+    )
 
-    return JSONResponse(
+    # Serialize straight to JSON bytes with pydantic-core, skipping the
+    # intermediate dict and a second encoding pass
+    return Response(
+        content=error_response.model_dump_json(),
         status_code=status_code,
-        content=error_response,
         headers=headers if headers else {},
+        media_type="application/json",
     )
 
 
 def extract_exceptions(exception_group: ExceptionGroup[Exception]) -> list[Exception]:
+    """Flatten nested exception groups into their leaf exceptions.
+
+    Walks the groups depth-first with an explicit stack of iterators instead of
+    recursing, preserving the order in which the exceptions were grouped.
+
+    Args:
+        exception_group: The exception group to flatten.
+
+    Returns:
+        The leaf exceptions, in order.
+    """
     all_exceptions: list[Exception] = []
-    for exception in exception_group.exceptions:
-        if isinstance(exception, ExceptionGroup):
-            all_exceptions.extend(extract_exceptions(exception))  # type: ignore
-        else:
+    stack: list[Iterator[Exception]] = [iter(exception_group.exceptions)]
+    while stack:
+        for exception in stack[-1]:
+            if isinstance(exception, ExceptionGroup):
+                # isinstance() cannot narrow the type parameter, but groups nested
+                # in an ExceptionGroup[Exception] only hold Exceptions too
+                nested_group = cast("ExceptionGroup[Exception]", exception)
+                # Resume the current group once the nested one is exhausted
+                stack.append(iter(nested_group.exceptions))
+                break
             all_exceptions.append(exception)
+        else:
+            stack.pop()
     return all_exceptions
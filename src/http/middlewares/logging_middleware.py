@@ -1,86 +1,130 @@
 import time
 
-from fastapi import Request
-from fastapi import Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.middleware.base import RequestResponseEndpoint
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
 
 from src.infrastructure.logging import getLogger
 from src.infrastructure.logging.api_call_context import ApiCallRequestContext
 from src.infrastructure.logging.api_call_context import ApiCallResponseContext
+from src.infrastructure.logging.api_call_context import RedactedHeaders
+from src.infrastructure.logging.api_call_context import get_request_id
 from src.infrastructure.logging.logger import request_context_var
 from src.infrastructure.logging.logger import response_context_var
 
 logger = getLogger(__name__)
 
+_REQUEST_ID_HEADER = b"dailymotion-request-id"
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """
-        Main dispatch method that orchestrates the request processing.
-        Calls before_request and after_request methods.
-        """
-        # Process before request with tracing
-        await self.before_request(request)
 
-        # Execute the actual request
-        response = await call_next(request)
+class LoggingMiddleware:
+    """Pure ASGI middleware logging each HTTP request and its response.
 
-        # Process after request with tracing
-        await self.after_request(request, response)
+    Works on the raw ASGI scope and messages: no Starlette Request/Response
+    objects are built, and the app runs in the caller's task instead of a
+    separate task group (as BaseHTTPMiddleware would).
+    """
 
-        return response
+    def __init__(self, app: ASGIApp, skip_paths: frozenset[str] = frozenset()) -> None:
+        """Initialize the logging middleware.
 
-    async def before_request(self, request: Request) -> None:
-        """Set up request context and logging before the request is handled."""
-        self._start_timer(request)
-        self._log_request_start(request)
-        self._create_request_context(request)
-
-    async def after_request(self, request: Request, response: Response) -> None:
-        """Log response and set headers after the request is processed."""
-        self._add_request_id_header(response, request.state.request_context)
-        self._create_response_context(request, response)
-        self._log_request_end(request, response)
+        Args:
+            app: The ASGI app to wrap.
+            skip_paths: Exact paths served without logging (e.g. healthchecks hit
+                by probes).
+        """
+        self.app = app
+        self.skip_paths = skip_paths
 
-    def _start_timer(self, request: Request) -> None:
-        """Start timing the request processing."""
-        request.state.start_time = time.monotonic()
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Main entry point that orchestrates the request processing.
+        Sets up the request context, then logs the response once it starts.
+        """
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.monotonic_ns()
+        method: str = scope["method"]
+        path: str = scope["path"]
+
+        logger.info("%s %s", method, path)
+        request_context = self._create_request_context(scope, method, path)
+        # Raw response header, encoded once per request
+        request_id_header = (
+            _REQUEST_ID_HEADER,
+            request_context.request_id.encode("latin-1"),
+        )
 
-    def _create_request_context(self, request: Request) -> None:
-        """Create and set the request context."""
+        status_code: int | None = None
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                response_status: int = message["status"]
+                status_code = response_status
+                # Headers may be any iterable of pairs, possibly owned by the
+                # response object: copy them into a new list instead of appending
+                headers: list[tuple[bytes, bytes]] = [
+                    *message.get("headers", ()),
+                    request_id_header,
+                ]
+                message["headers"] = headers
+                self._create_response_context(
+                    response_status, headers, start_ns, request_context.request_id
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+        if status_code is not None:
+            logger.info("%s %s %d", method, path, status_code)
+
+    def _create_request_context(
+        self, scope: Scope, method: str, path: str
+    ) -> ApiCallRequestContext:
+        """Create and set the request context.
+
+        Headers are decoded only when a log record reads them. Handlers get the
+        same context in the scope state as request.state.request_context.
+        """
+        raw_headers: list[tuple[bytes, bytes]] = scope["headers"]
+        request_id = get_request_id(
+            next(
+                (
+                    value.decode("latin-1")
+                    for name, value in raw_headers
+                    if name == _REQUEST_ID_HEADER
+                ),
+                None,
+            )
+        )
         request_context = ApiCallRequestContext(
-            method=request.method,
-            url_path=request.url.path,
-            request_headers=dict(request.headers),
+            method=method,
+            url_path=path,
+            request_headers=RedactedHeaders(raw_headers),
+            request_id=request_id,
         )
-        request.state.request_context = request_context
-        request_context_var.set(request_context.model_dump())
-
-    def _log_request_start(self, request: Request) -> None:
-        """Log the start of request processing."""
-        logger.info(f"{request.method.upper()} {request.url.path}")
-
-    def _add_request_id_header(
-        self, response: Response, request_context: ApiCallRequestContext
+        request_context_var.set(request_context.as_dict())
+        scope.setdefault("state", {})["request_context"] = request_context
+        return request_context
+
+    def _create_response_context(
+        self,
+        status_code: int,
+        headers: list[tuple[bytes, bytes]],
+        start_ns: int,
+        request_id: str,
     ) -> None:
-        """Add the request ID to the response headers."""
-        response.headers["dailymotion-request-id"] = str(request_context.request_id)
-
-    def _create_response_context(self, request: Request, response: Response) -> None:
         """Create and set the response context with timing information."""
-        elapsed_ms = (time.monotonic() - request.state.start_time) * 1_000
+        elapsed_ms = (time.monotonic_ns() - start_ns) / 1_000_000
         response_context = ApiCallResponseContext(
-            status_code=response.status_code,
+            status_code=status_code,
             response_time_ms=elapsed_ms,
-            response_headers=dict(response.headers),
-        )
-        response_context_var.set(response_context.model_dump())
-
-    def _log_request_end(self, request: Request, response: Response) -> None:
-        """Log the completion of request processing."""
-        logger.info(
-            f"{request.method.upper()} {request.url.path} {response.status_code}"
+            response_headers=RedactedHeaders(headers),
+            request_id=request_id,
         )
+        response_context_var.set(response_context.as_dict())
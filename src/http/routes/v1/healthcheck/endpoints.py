@@ -2,6 +2,7 @@ import datetime
 
 import asyncpg
 from fastapi import APIRouter
+from fastapi import Response
 from fastapi import status
 
 from src.http.dependencies.database_asyncpg import DbConnection
@@ -10,13 +11,25 @@ from src.http.routes.v1.healthcheck.schemas import HealthcheckStatus
 
 router = APIRouter()
 
+# Preformatted body of the healthy response, so probes skip model construction and
+# serialization; only the timestamp placeholder is filled in per request
+_HEALTHY_BODY_TEMPLATE = (
+    HealthcheckResponse(
+        status=HealthcheckStatus.OK,
+        timestamp="%s",
+        message="Service is healthy",
+    )
+    .model_dump_json(by_alias=True)
+    .encode()
+)
+
 
 @router.get(
     "",
     response_model=HealthcheckResponse,
     status_code=status.HTTP_200_OK,
 )
-async def healthcheck(conn: DbConnection) -> HealthcheckResponse:
+async def healthcheck(conn: DbConnection) -> HealthcheckResponse | Response:
     """Health check endpoint with database connectivity check.
 
     Args:
@@ -25,32 +38,25 @@ async def healthcheck(conn: DbConnection) -> HealthcheckResponse:
     Returns:
         Health status response with database connectivity status.
     """
-    # Check database connectivity
-    db_status = HealthcheckStatus.OK
-    db_message = "Database is healthy"
+    # Check database connectivity (no failure message when healthy)
     try:
-        result = await conn.fetchval("SELECT 1")
-        if result != 1:
-            db_status = HealthcheckStatus.KO
-            db_message = "Database returned unexpected result"
+        db_message = (
+            None
+            if await conn.fetchval("SELECT 1") == 1
+            else "Database returned unexpected result"
+        )
     except (asyncpg.PostgresError, asyncpg.InterfaceError, OSError) as e:
-        db_status = HealthcheckStatus.KO
-        db_message = f"Database connection failed: {e!s}"
-
-    # Determine overall status
-    overall_status = (
-        HealthcheckStatus.OK
-        if db_status == HealthcheckStatus.OK
-        else HealthcheckStatus.KO
-    )
-    message = (
-        "Service is healthy"
-        if overall_status == HealthcheckStatus.OK
-        else f"Service unhealthy: {db_message}"
-    )
+        db_message = f"Database connection failed: {e}"
+
+    timestamp = datetime.datetime.now(datetime.UTC).isoformat()
+    if db_message is None:
+        return Response(
+            content=_HEALTHY_BODY_TEMPLATE % timestamp.encode(),
+            media_type="application/json",
+        )
 
     return HealthcheckResponse(
-        status=overall_status,
-        timestamp=datetime.datetime.now(datetime.UTC).isoformat(),
-        message=message,
+        status=HealthcheckStatus.KO,
+        timestamp=timestamp,
+        message=f"Service unhealthy: {db_message}",
     )
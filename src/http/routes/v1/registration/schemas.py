@@ -1,6 +1,10 @@
+from typing import Annotated
+
+from pydantic import AfterValidator
 from pydantic import BaseModel
 from pydantic import EmailStr
 from pydantic import Field
+from pydantic import StringConstraints
 from pydantic import field_validator
 
 from src.domain.user.entities.activation_code import ACTIVATION_CODE_LENGTH
@@ -8,46 +12,54 @@ from src.domain.user.entities.activation_code import ActivationCode
 from src.domain.user.value_objects.password import Password
 
 
+def _validate_password(v: str) -> str:
+    """Validate password using Password value object.
+
+    Args:
+        v: Password string to validate
+
+    Returns:
+        Validated password string
+
+    Raises:
+        ValueError: If password validation fails
+    """
+    # Use Password value object to validate
+    # This will raise ExceptionGroup if validation fails
+    try:
+        Password(v)
+    except ExceptionGroup as e:
+        # Convert ExceptionGroup to ValueError for Pydantic
+        # Combine all error messages into one
+        error_messages = [
+            str(exc) for exc in e.exceptions if isinstance(exc, ValueError)
+        ]
+        error_msg = (
+            "; ".join(error_messages)
+            if error_messages
+            else "Password validation failed"
+        )
+        raise ValueError(error_msg) from e
+    return v
+
+
+# The maximum length is checked by pydantic-core before any Python code runs,
+# so oversized passwords are rejected without calling the validator
+PasswordStr = Annotated[
+    str,
+    StringConstraints(max_length=Password.MAX_LENGTH),
+    AfterValidator(_validate_password),
+]
+
+
 class RegisterUserRequest(BaseModel):
     """Request schema for user registration."""
 
     email: EmailStr = Field(..., description="User's email address")
-    password: str = Field(
+    password: PasswordStr = Field(
         ..., description="User's password", examples=["SecurePass123!"]
     )
 
-    @field_validator("password")
-    @classmethod
-    def validate_password(cls, v: str) -> str:
-        """Validate password using Password value object.
-
-        Args:
-            v: Password string to validate
-
-        Returns:
-            Validated password string
-
-        Raises:
-            ValueError: If password validation fails
-        """
-        # Use Password value object to validate
-        # This will raise ExceptionGroup if validation fails
-        try:
-            Password(v)
-        except ExceptionGroup as e:
-            # Convert ExceptionGroup to ValueError for Pydantic
-            # Combine all error messages into one
-            error_messages = [
-                str(exc) for exc in e.exceptions if isinstance(exc, ValueError)
-            ]
-            error_msg = (
-                "; ".join(error_messages)
-                if error_messages
-                else "Password validation failed"
-            )
-            raise ValueError(error_msg) from e
-        return v
-
 
 class PublicUserResponse(BaseModel):
     """Response schema for public user information."""
@@ -1,31 +1,51 @@
 import asyncio
-import os
 
 import asyncpg
+from asyncpg.pool import PoolConnectionProxy
 
+from src.infrastructure.database.postgres.dsn import get_database_url
 
-async def clear_database_data() -> None:
-    """Clear all rows from tables while preserving table structure."""
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        raise ValueError("DATABASE_URL environment variable is not set")
+
+async def _clear_data_on(conn: asyncpg.Connection | PoolConnectionProxy) -> None:
+    """Clear all rows from tables on a connection.
+
+    Args:
+        conn: Database connection, dedicated or borrowed from a pool.
+    """
+    # Clear database data: Remove all rows but keep table structure
+    # This ensures a clean state on every compose up
+    print("Clearing database data (removing all rows)...")
+    # Use TRUNCATE to clear rows while preserving table structure
+    # Both tables in one statement: one round trip, locks taken together
+    # RESTART IDENTITY resets the id sequences for a fresh start
+    # CASCADE ensures foreign key constraints are handled
+    await conn.execute(
+        "TRUNCATE TABLE activation_codes, users RESTART IDENTITY CASCADE"
+    )
+    print("✓ Database data cleared (tables preserved, all rows removed)")
+
+
+async def clear_database_data(pool: asyncpg.Pool | None = None) -> None:
+    """Clear all rows from tables while preserving table structure.
+
+    Args:
+        pool: Connection pool to borrow an already-open connection from (e.g. the
+            app's pool). If None, a dedicated connection to DATABASE_URL is opened.
+    """
+    if pool is not None:
+        async with pool.acquire() as conn:
+            await _clear_data_on(conn)
+        return
 
     # Connect to database
     try:
-        conn = await asyncpg.connect(database_url)
+        conn = await asyncpg.connect(get_database_url())
     except Exception as e:
         print(f"Failed to connect to database: {e}")
         raise
 
     try:
-        # Clear database data: Remove all rows but keep table structure
-        # This ensures a clean state on every compose up
-        print("Clearing database data (removing all rows)...")
-        # Use TRUNCATE to clear rows while preserving table structure
-        # CASCADE ensures foreign key constraints are handled
-        await conn.execute("TRUNCATE TABLE activation_codes CASCADE")
-        await conn.execute("TRUNCATE TABLE users CASCADE")
-        print("✓ Database data cleared (tables preserved, all rows removed)")
+        await _clear_data_on(conn)
     finally:
         await conn.close()
 
@@ -0,0 +1,21 @@
+"""PostgreSQL connection settings, read from the environment."""
+
+import os
+
+
+def get_database_url() -> str:
+    """Return the PostgreSQL connection URL from the DATABASE_URL env var.
+
+    The URL is handed to asyncpg as-is: its DSN parser also handles query
+    parameters (e.g. sslmode), Unix sockets and multiple hosts.
+
+    Returns:
+        The connection URL.
+
+    Raises:
+        ValueError: If DATABASE_URL is not set.
+    """
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable is not set")
+    return database_url
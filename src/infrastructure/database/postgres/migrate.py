@@ -1,49 +1,111 @@
 import asyncio
-import os
 from pathlib import Path
 
 import asyncpg
+from asyncpg.pool import PoolConnectionProxy
 
+from src.infrastructure.database.postgres.dsn import get_database_url
 
-async def run_migrations() -> None:
-    """Run all migration files in order."""
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        raise ValueError("DATABASE_URL environment variable is not set")
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
 
+# Filenames of applied migrations, so each file only runs once per database
+_CREATE_SCHEMA_MIGRATIONS = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        filename TEXT PRIMARY KEY,
+        applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT (NOW() AT TIME ZONE 'UTC')
+    )
+"""
+
+
+async def apply_migrations(
+    conn: asyncpg.Connection | PoolConnectionProxy, migration_files: list[Path]
+) -> list[Path]:
+    """Apply the pending migrations in a single transaction.
+
+    Migrations already recorded in schema_migrations are skipped. If any pending
+    migration fails, none of them is applied.
+
+    Args:
+        conn: Database connection, dedicated or borrowed from a pool.
+        migration_files: Migration files, in the order to apply them.
+
+    Returns:
+        The migration files applied.
+    """
+    await conn.execute(_CREATE_SCHEMA_MIGRATIONS)
+    applied = {
+        row["filename"]
+        for row in await conn.fetch("SELECT filename FROM schema_migrations")
+    }
+    pending = [file for file in migration_files if file.name not in applied]
+    if not pending:
+        return []
+
+    async with conn.transaction():
+        for migration_file in pending:
+            print(f"Applying migration: {migration_file.name}")
+            # Decode the raw bytes directly: no locale lookup or newline translation
+            await conn.execute(migration_file.read_bytes().decode("utf-8"))
+        await conn.execute(
+            "INSERT INTO schema_migrations (filename) SELECT unnest($1::text[])",
+            [migration_file.name for migration_file in pending],
+        )
+    return pending
+
+
+async def _run_migrations_on(
+    conn: asyncpg.Connection | PoolConnectionProxy, migration_files: list[Path]
+) -> None:
+    """Apply the pending migrations on a connection and report the outcome.
+
+    Args:
+        conn: Database connection, dedicated or borrowed from a pool.
+        migration_files: Migration files, in the order to apply them.
+    """
+    try:
+        applied = await apply_migrations(conn, migration_files)
+    except Exception as e:
+        print(f"✗ Failed to apply migrations, none were applied: {e}")
+        raise
+
+    for migration_file in applied:
+        print(f"✓ Applied {migration_file.name}")
+    print("All migrations applied successfully!")
+
+
+async def run_migrations(pool: asyncpg.Pool | None = None) -> None:
+    """Run all pending migration files in order.
+
+    Args:
+        pool: Connection pool to borrow an already-open connection from (e.g. the
+            app's pool). If None, a dedicated connection to DATABASE_URL is opened.
+    """
     # Get migrations directory
-    migrations_dir = Path(__file__).parent / "migrations"
-    if not migrations_dir.exists():
-        raise FileNotFoundError(f"Migrations directory not found: {migrations_dir}")
+    if not MIGRATIONS_DIR.exists():
+        raise FileNotFoundError(f"Migrations directory not found: {MIGRATIONS_DIR}")
 
     # Get all migration files sorted by name
-    migration_files = sorted(migrations_dir.glob("*.sql"))
+    migration_files = sorted(MIGRATIONS_DIR.glob("*.sql"))
     if not migration_files:
         print("No migration files found.")
         return
 
     print(f"Found {len(migration_files)} migration file(s)")
 
+    if pool is not None:
+        async with pool.acquire() as conn:
+            await _run_migrations_on(conn, migration_files)
+        return
+
     # Connect to database
     try:
-        conn = await asyncpg.connect(database_url)
+        conn = await asyncpg.connect(get_database_url())
     except Exception as e:
         print(f"Failed to connect to database: {e}")
         raise
 
     try:
-        # Apply migrations
-        for migration_file in migration_files:
-            print(f"Applying migration: {migration_file.name}")
-            try:
-                migration_sql = migration_file.read_text()
-                await conn.execute(migration_sql)
-                print(f"✓ Applied {migration_file.name}")
-            except Exception as e:
-                print(f"✗ Failed to apply {migration_file.name}: {e}")
-                raise
-
-        print("All migrations applied successfully!")
+        await _run_migrations_on(conn, migration_files)
     finally:
         await conn.close()
 
@@ -1,6 +1,3 @@
-from datetime import UTC
-from datetime import datetime
-
 import asyncpg
 from asyncpg.pool import PoolConnectionProxy
 
@@ -12,6 +9,35 @@ from src.domain.user.entities.activation_code import ActivationCodeStatus
 from src.domain.user.entities.user import UserId
 from src.domain.user.errors import ActivationCodeNotFoundError
 
+# SQL statements, shared by every repository instance. Statements returning
+# activation codes select their columns in the order row_to_activation_code
+# unpacks them.
+_UPSERT_ACTIVATION_CODE = """
+    INSERT INTO activation_codes (user_id, code, expires_at, status)
+    VALUES ($1, $2, $3, $4)
+    ON CONFLICT (user_id, code) DO UPDATE
+    SET expires_at = EXCLUDED.expires_at,
+        status = EXCLUDED.status,
+        updated_at = (NOW() AT TIME ZONE 'UTC')
+"""
+
+_SELECT_ACTIVATION_CODE = """
+    SELECT user_id, code, expires_at, status
+    FROM activation_codes
+    WHERE user_id = $1 AND code = $2
+"""
+
+_MARK_ACTIVATION_CODE_USED = """
+    UPDATE activation_codes
+    SET status = 'used', updated_at = (NOW() AT TIME ZONE 'UTC')
+    WHERE user_id = $1 AND status = 'pending'
+"""
+
+# Stored status value -> member: a dict lookup instead of an Enum call per row
+_ACTIVATION_CODE_STATUS_BY_VALUE = {
+    status.value: status for status in ActivationCodeStatus
+}
+
 
 class PostgresActivationCodeDataMapper:
     """Data mapper for converting between PostgreSQL rows and ActivationCode entities."""
@@ -21,25 +47,20 @@ class PostgresActivationCodeDataMapper:
         """Convert database row to ActivationCode entity.
 
         Args:
-            row: Database record
+            row: Database record (user_id, code, expires_at, status)
 
         Returns:
             ActivationCode entity
         """
-        expires_at = row["expires_at"]
-        if isinstance(expires_at, datetime):
-            # Ensure timezone-aware datetime
-            if expires_at.tzinfo is None:
-                expires_at = expires_at.replace(tzinfo=UTC)
-        else:
-            # Convert string to datetime if needed
-            expires_at = datetime.fromisoformat(str(expires_at))
-
+        # Unpack by position: skips the per-column name lookups of row["..."]
+        user_id, code, expires_at, status = row
+        # expires_at is a TIMESTAMP WITH TIME ZONE column: asyncpg decodes it to a
+        # timezone-aware (UTC) datetime
         return ActivationCode(
-            user_id=UserId(row["user_id"]),
-            code=row["code"],
+            user_id=UserId(user_id),
+            code=code,
             expires_at=expires_at,
-            status=ActivationCodeStatus(row["status"]),
+            status=_ACTIVATION_CODE_STATUS_BY_VALUE[status],
         )
 
 
@@ -63,14 +84,7 @@ class PostgresActivationCodeRepository(
             activation_code: The activation code entity to save
         """
         await self._conn.execute(
-            """
-            INSERT INTO activation_codes (user_id, code, expires_at, status)
-            VALUES ($1, $2, $3, $4)
-            ON CONFLICT (user_id, code) DO UPDATE
-            SET expires_at = EXCLUDED.expires_at,
-                status = EXCLUDED.status,
-                updated_at = (NOW() AT TIME ZONE 'UTC')
-            """,
+            _UPSERT_ACTIVATION_CODE,
             activation_code.user_id,
             activation_code.code,
             activation_code.expires_at,
@@ -93,11 +107,7 @@ class PostgresActivationCodeRepository(
             ActivationCodeNotFoundError: If activation code not found
         """
         row = await self._conn.fetchrow(
-            """
-            SELECT user_id, code, expires_at, status
-            FROM activation_codes
-            WHERE user_id = $1 AND code = $2
-            """,
+            _SELECT_ACTIVATION_CODE,
             user_id,
             code,
         )
@@ -114,10 +124,6 @@ class PostgresActivationCodeRepository(
             user_id: The user's internal ID
         """
         await self._conn.execute(
-            """
-            UPDATE activation_codes
-            SET status = 'used', updated_at = (NOW() AT TIME ZONE 'UTC')
-            WHERE user_id = $1 AND status = 'pending'
-            """,
+            _MARK_ACTIVATION_CODE_USED,
             user_id,
         )
@@ -1,8 +1,5 @@
-from uuid import UUID
-
 import asyncpg
 from asyncpg.pool import PoolConnectionProxy
-from pydantic import EmailStr
 
 from src.application.registration.ports.user_repository import UserRepository
 from src.domain.user.entities.user import User
@@ -13,6 +10,42 @@ from src.domain.user.errors import UserAlreadyExistsError
 from src.domain.user.errors import UserNotFoundError
 from src.domain.user.value_objects.password_hash import PasswordHash
 
+# SQL statements, shared by every repository instance. Statements returning
+# users select their columns in the order row_to_user unpacks them.
+_INSERT_USER = """
+    INSERT INTO users (public_id, email, password_hash, status)
+    VALUES ($1, $2, $3, $4)
+    RETURNING id
+"""
+
+_SELECT_USER_BY_ID = """
+    SELECT id, public_id, email, password_hash, status
+    FROM users
+    WHERE id = $1
+"""
+
+_SELECT_USER_BY_PUBLIC_ID = """
+    SELECT id, public_id, email, password_hash, status
+    FROM users
+    WHERE public_id = $1
+"""
+
+_SELECT_USER_BY_EMAIL = """
+    SELECT id, public_id, email, password_hash, status
+    FROM users
+    WHERE email = $1
+"""
+
+_UPDATE_USER_STATUS = """
+    UPDATE users
+    SET status = $1, updated_at = (NOW() AT TIME ZONE 'UTC')
+    WHERE id = $2
+    RETURNING id, public_id, email, password_hash, status
+"""
+
+# Stored status value -> member: a dict lookup instead of an Enum call per row
+_USER_STATUS_BY_VALUE = {status.value: status for status in UserStatus}
+
 
 class PostgresUserDataMapper:
     """Data mapper for converting between PostgreSQL rows and User entities."""
@@ -22,25 +55,22 @@ class PostgresUserDataMapper:
         """Convert database row to User entity.
 
         Args:
-            row: Database record
+            row: Database record (id, public_id, email, password_hash, status)
 
         Returns:
             User entity
         """
+        # Unpack by position: skips the per-column name lookups of row["..."]
+        user_id, stored_uuid, email, password_hash, status = row
         # Reconstruct PublicId from UUID stored in database
-        # The database stores just the UUID, but we need to add the prefix
-        stored_uuid = row["public_id"]
-        if isinstance(stored_uuid, str):
-            # If it's a string, parse it as UUID
-            stored_uuid = UUID(stored_uuid)
-        public_id = UserPublicId(prefix=UserPublicId.PREFIX, uuid_v7=stored_uuid)
-
+        # The database stores just the UUID (a uuid column, decoded to UUID by
+        # asyncpg), the prefix comes from the PublicId class
         return User(
-            id=UserId(row["id"]),
-            public_id=public_id,
-            email=row["email"],
-            password_hash=PasswordHash(value=row["password_hash"]),
-            status=UserStatus(row["status"]),
+            id=UserId(user_id),
+            public_id=UserPublicId.from_uuid(stored_uuid),
+            email=email,
+            password_hash=PasswordHash(value=password_hash),
+            status=_USER_STATUS_BY_VALUE[status],
         )
 
 
@@ -55,7 +85,7 @@ class PostgresUserRepository(UserRepository, PostgresUserDataMapper):
         """
         self._conn = connection
 
-    async def create(self, email: EmailStr, password_hash: PasswordHash) -> User:
+    async def create(self, email: str, password_hash: PasswordHash) -> User:
         """Create a new user.
 
         Args:
@@ -74,12 +104,8 @@ class PostgresUserRepository(UserRepository, PostgresUserDataMapper):
         try:
             # Insert user with PENDING status
             # Store only the UUID part (uuid_v7) in the database
-            row = await self._conn.fetchrow(
-                """
-                INSERT INTO users (public_id, email, password_hash, status)
-                VALUES ($1, $2, $3, $4)
-                RETURNING id, public_id, email, password_hash, status
-                """,
+            user_id = await self._conn.fetchval(
+                _INSERT_USER,
                 public_id.uuid_v7,  # Store UUID object directly
                 email,
                 password_hash.value,
@@ -92,10 +118,17 @@ class PostgresUserRepository(UserRepository, PostgresUserDataMapper):
                 ) from e
             raise
 
-        if row is None:
+        if user_id is None:
             raise RuntimeError("Failed to create user")
 
-        return self.row_to_user(row)
+        # All other columns are the values just inserted: build the user locally
+        return User(
+            id=UserId(user_id),
+            public_id=public_id,
+            email=email,
+            password_hash=password_hash,
+            status=UserStatus.PENDING,
+        )
 
     async def find_by_id(self, user_id: UserId) -> User:
         """Find a user by internal ID.
@@ -110,11 +143,7 @@ class PostgresUserRepository(UserRepository, PostgresUserDataMapper):
             UserNotFoundError: If user not found
         """
         row = await self._conn.fetchrow(
-            """
-            SELECT id, public_id, email, password_hash, status
-            FROM users
-            WHERE id = $1
-            """,
+            _SELECT_USER_BY_ID,
             user_id,
         )
 
@@ -136,11 +165,7 @@ class PostgresUserRepository(UserRepository, PostgresUserDataMapper):
             UserNotFoundError: If user not found
         """
         row = await self._conn.fetchrow(
-            """
-            SELECT id, public_id, email, password_hash, status
-            FROM users
-            WHERE public_id = $1
-            """,
+            _SELECT_USER_BY_PUBLIC_ID,
             public_id.uuid_v7,  # Query using UUID part
         )
 
@@ -162,11 +187,7 @@ class PostgresUserRepository(UserRepository, PostgresUserDataMapper):
             UserNotFoundError: If user not found
         """
         row = await self._conn.fetchrow(
-            """
-            SELECT id, public_id, email, password_hash, status
-            FROM users
-            WHERE email = $1
-            """,
+            _SELECT_USER_BY_EMAIL,
             email,
         )
 
@@ -189,12 +210,7 @@ class PostgresUserRepository(UserRepository, PostgresUserDataMapper):
             UserNotFoundError: If user not found
         """
         row = await self._conn.fetchrow(
-            """
-            UPDATE users
-            SET status = $1, updated_at = (NOW() AT TIME ZONE 'UTC')
-            WHERE id = $2
-            RETURNING id, public_id, email, password_hash, status
-            """,
+            _UPDATE_USER_STATUS,
             status.value,
             user_id,
         )
@@ -0,0 +1,60 @@
+from types import TracebackType
+from typing import Self
+
+from asyncpg.pool import PoolConnectionProxy
+from asyncpg.transaction import Transaction
+
+from src.application.registration.ports.unit_of_work import UnitOfWork
+
+
+class PostgresUnitOfWork(UnitOfWork):
+    """PostgreSQL implementation of UnitOfWork using an asyncpg transaction.
+
+    The unit of work runs on the same connection as the request's repositories,
+    so every write inside the block shares one BEGIN/COMMIT instead of each
+    statement committing on its own.
+    """
+
+    def __init__(self, connection: PoolConnectionProxy) -> None:
+        """Initialize unit of work with database connection.
+
+        Args:
+            connection: Database connection shared with the repositories
+        """
+        self._connection = connection
+        self._transaction: Transaction | None = None
+
+    async def __aenter__(self) -> Self:
+        """Start a transaction on the connection.
+
+        Returns:
+            The unit of work itself
+        """
+        self._transaction = self._connection.transaction()
+        await self._transaction.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Commit the transaction, or roll it back if an exception was raised.
+
+        Args:
+            exc_type: Type of the exception raised in the block, if any
+            exc: Exception raised in the block, if any
+            traceback: Traceback of the exception raised in the block, if any
+
+        Raises:
+            RuntimeError: If the unit of work was not started
+        """
+        if self._transaction is None:
+            raise RuntimeError("Unit of work has not been started.")
+
+        transaction, self._transaction = self._transaction, None
+        if exc_type is None:
+            await transaction.commit()
+        else:
+            await transaction.rollback()
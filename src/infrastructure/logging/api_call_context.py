@@ -1,68 +1,137 @@
+import re
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 from uuid import uuid4
 
-from pydantic import BaseModel
-from pydantic import ConfigDict
-from pydantic import computed_field
-from pydantic import model_validator
-from pydantic.alias_generators import to_camel
+# Header names containing any of these (other than authorization) are redacted
+_SENSITIVE_HEADER_PATTERN = re.compile(r"token|key|cookie")
 
 
-def redact_headers(headers: dict[str, Any]) -> dict[str, Any]:
+@lru_cache(maxsize=1024)
+def _redaction(header_name: str) -> str | None:
+    """Return the redacted value for a header name, or None to keep the value.
+
+    Requests reuse a small set of header names, so decisions are memoized.
+    """
+    header_name = header_name.lower()
     # Redact Authorization headers
+    if "authorization" in header_name:
+        return "Bearer [REDACTED]"
+    if _SENSITIVE_HEADER_PATTERN.search(header_name):
+        return "[REDACTED]"
+    return None
+
+
+def redact_headers(headers: dict[str, Any]) -> dict[str, Any]:
     for header_name in headers:
-        if "authorization" in header_name.lower():
-            headers[header_name] = "Bearer [REDACTED]"
-        elif (
-            "token" in header_name.lower()
-            or "key" in header_name.lower()
-            or "cookie" in header_name.lower()
-        ):
-            headers[header_name] = "[REDACTED]"
+        redacted = _redaction(header_name)
+        if redacted is not None:
+            headers[header_name] = redacted
 
     return headers
 
 
-class ApiCallRequestContext(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel)
+# Canonical form of a UUID, returned as-is without parsing
+_CANONICAL_UUID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
+
+def get_request_id(request_id: str | None) -> str:
+    """Return the normalized request ID from its header value, or a new one.
+
+    Args:
+        request_id: The request ID header value, if any.
+
+    Returns:
+        The request ID as a canonical UUID string. A new random ID is generated
+        when the header is missing or not a UUID.
+    """
+    if request_id:
+        if _CANONICAL_UUID_PATTERN.fullmatch(request_id):
+            return request_id
+        try:
+            return str(UUID(hex=request_id))
+        except ValueError:
+            pass
+    return str(uuid4())
+
+
+class RedactedHeaders(Mapping[str, str]):
+    """Read-only view of raw ASGI headers, decoded and redacted on first access.
+
+    Holds a reference to the raw header pairs, so requests whose context is
+    never read by a log record pay no decoding or copying cost.
+    """
+
+    __slots__ = ("_headers", "_raw_headers")
+
+    def __init__(self, raw_headers: Iterable[tuple[bytes, bytes]]) -> None:
+        self._raw_headers = raw_headers
+        self._headers: dict[str, str] | None = None
+
+    def _decoded(self) -> dict[str, str]:
+        if self._headers is None:
+            # Same decoding as Starlette's Headers: latin-1, last duplicate wins
+            self._headers = redact_headers(
+                {
+                    name.decode("latin-1"): value.decode("latin-1")
+                    for name, value in self._raw_headers
+                }
+            )
+        return self._headers
+
+    def __getitem__(self, key: str) -> str:
+        return self._decoded()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._decoded())
+
+    def __len__(self) -> int:
+        return len(self._decoded())
+
+    def __repr__(self) -> str:
+        return repr(self._decoded())
+
+
+@dataclass(frozen=True, slots=True)
+class ApiCallRequestContext:
+    """Request details, exposed to handlers as request.state.request_context."""
 
     method: str
     url_path: str
-    request_headers: dict[str, Any]
-
-    @model_validator(mode="after")
-    def redact_headers(self) -> ApiCallRequestContext:
-        self.request_headers = redact_headers(self.request_headers)
-        return self
-
-    @computed_field
-    def request_id(self) -> str:
-        return str(
-            UUID(
-                hex=(self.request_headers.get("dailymotion-request-id") or str(uuid4()))
-            )
-        )
+    request_headers: Mapping[str, str]
+    request_id: str
 
+    def as_dict(self) -> dict[str, Any]:
+        """Return the context as logged with each record."""
+        return {
+            "method": self.method,
+            "url_path": self.url_path,
+            "request_headers": self.request_headers,
+            "request_id": self.request_id,
+        }
 
-class ApiCallResponseContext(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel)
+
+@dataclass(frozen=True, slots=True)
+class ApiCallResponseContext:
+    """Response details, logged with the records emitted once the response starts."""
 
     status_code: int
     response_time_ms: float
-    response_headers: dict[str, Any]
-
-    @model_validator(mode="after")
-    def redact_headers(self) -> ApiCallResponseContext:
-        self.response_headers = redact_headers(self.response_headers)
-        return self
-
-    @computed_field
-    def request_id(self) -> str:
-        return str(
-            UUID(
-                hex=(
-                    self.response_headers.get("dailymotion-request-id") or str(uuid4())
-                )
-            )
-        )
+    response_headers: Mapping[str, str]
+    request_id: str
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the context as logged with each record."""
+        return {
+            "status_code": self.status_code,
+            "response_time_ms": self.response_time_ms,
+            "response_headers": self.response_headers,
+            "request_id": self.request_id,
+        }
@@ -1,9 +1,14 @@
 import logging
 import os
+import sys
+from collections.abc import Mapping
 from collections.abc import MutableMapping
 from contextvars import ContextVar
+from functools import cache
 from typing import Any
+from typing import cast
 
+import orjson
 from rich.logging import RichHandler
 
 # Holds per-request context (e.g., added in logging middleware)
@@ -19,14 +24,61 @@ response_context_var: ContextVar[dict[str, Any]] = ContextVar(
 
 class ApiCallContextFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
-        json_fields_data: MutableMapping[str, Any] = getattr(record, "json_fields", {})
-        json_fields_data.update(request_context_var.get({}))
-        json_fields_data.update(response_context_var.get({}))
+        # Context variables fall back to their shared empty default. Outside a
+        # request (startup, background tasks) both are empty: leave the record
+        # untouched instead of allocating json_fields for nothing
+        request_context = request_context_var.get()
+        response_context = response_context_var.get()
+        if not request_context and not response_context:
+            return True
 
-        record.json_fields = json_fields_data
+        json_fields_data: MutableMapping[str, Any] = record.__dict__.setdefault(
+            "json_fields", {}
+        )
+        if request_context:
+            json_fields_data.update(request_context)
+        if response_context:
+            json_fields_data.update(response_context)
         return True
 
 
+def _json_default(value: Any) -> Any:
+    """Serialize values orjson does not support natively (e.g. header mappings)."""
+    if isinstance(value, Mapping):
+        return dict(cast("Mapping[str, Any]", value))
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, including the API call context."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields: dict[str, Any] = {
+            "timestamp": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        fields.update(getattr(record, "json_fields", ()))
+        if record.exc_info:
+            fields["exception"] = self.formatException(record.exc_info)
+        return orjson.dumps(fields, default=_json_default).decode()
+
+
+def _build_handler() -> logging.Handler:
+    """Build the log handler for the configured LOG_FORMAT.
+
+    Rich console output is only worth its rendering cost for a human reading a
+    terminal: by default, it is used when stderr is a TTY, and JSON lines otherwise.
+    """
+    log_format = os.getenv("LOG_FORMAT") or ("rich" if sys.stderr.isatty() else "json")
+    if log_format == "json":
+        handler = logging.StreamHandler()
+        handler.setFormatter(JsonFormatter())
+        return handler
+    return RichHandler()
+
+
 class PrefixAdapter(logging.LoggerAdapter):  # type: ignore [reportMissingTypeArgument]
     def __init__(self, prefix: str | None = None, *args, **kwargs) -> None:  # type: ignore [reportUnknownParameterType, reportMissingParameterType]
         super().__init__(*args, **kwargs)  # type: ignore [reportUnknownMemberType, reportUnknownArgumentType]
@@ -40,6 +92,8 @@ class PrefixAdapter(logging.LoggerAdapter):  # type: ignore [reportMissingTypeAr
         return msg, kwargs
 
 
+# Loggers are configured once per (name, prefix); later calls reuse the adapter
+@cache
 def getLogger(name: str | None = None, prefix: str | None = None) -> PrefixAdapter:
     logger = logging.getLogger(name)
     logger.propagate = False
@@ -49,10 +103,10 @@ def getLogger(name: str | None = None, prefix: str | None = None) -> PrefixAdapt
     logger.setLevel(getattr(logging, log_level, logging.INFO))
 
     if not logger.hasHandlers():
-        # Currently using RichHandler for local and coding test.
+        # Currently using RichHandler for local and coding test, JSON lines otherwise.
         # Either add DatadogHandler or GCP CloudLoggingHandler for remote deployment.
         # Maybe even use a company logging package for consitency across projects.
-        handler = RichHandler()
+        handler = _build_handler()
         handler.setLevel(
             logging.DEBUG
         )  # Handler should accept all levels, logger controls what's shown
@@ -1,4 +1,6 @@
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import bcrypt
 
@@ -6,6 +8,11 @@ from src.application.registration.ports.password_hasher import PasswordHasher
 from src.domain.user.value_objects.password import Password
 from src.domain.user.value_objects.password_hash import PasswordHash
 
+# Bcrypt releases the GIL while hashing, so a dedicated pool sized to the CPU count
+# lets concurrent hash/verify calls run in parallel without starving the event loop
+# or competing with the default executor used by other blocking calls.
+_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="bcrypt")
+
 
 class BcryptPasswordHasher(PasswordHasher):
     """Bcrypt local adapter implementation of password hasher."""
@@ -23,8 +30,8 @@ class BcryptPasswordHasher(PasswordHasher):
             cost_factor = int(os.getenv("BCRYPT_COST_FACTOR", "12"))
         self._cost_factor = cost_factor
 
-    def hash(self, password: Password) -> PasswordHash:
-        """Hash a password using bcrypt.
+    async def hash(self, password: Password) -> PasswordHash:
+        """Hash a password using bcrypt in the hashing thread pool.
 
         Args:
             password: The password value object to hash
@@ -36,12 +43,16 @@ class BcryptPasswordHasher(PasswordHasher):
         password_bytes = password.value.encode("utf-8")
         # Generate salt and hash with configured cost factor
         # bcrypt handles salt automatically
-        hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=self._cost_factor))
+        salt = bcrypt.gensalt(rounds=self._cost_factor)
+        loop = asyncio.get_running_loop()
+        hashed = await loop.run_in_executor(
+            _EXECUTOR, bcrypt.hashpw, password_bytes, salt
+        )
         # Return as string (bcrypt hash is ASCII-safe)
         return PasswordHash(value=hashed.decode("utf-8"))
 
-    def verify(self, password: Password, password_hash: PasswordHash) -> bool:
-        """Verify a password against a bcrypt hash.
+    async def verify(self, password: Password, password_hash: PasswordHash) -> bool:
+        """Verify a password against a bcrypt hash in the hashing thread pool.
 
         Args:
             password: The password value object to verify
@@ -52,4 +63,7 @@ class BcryptPasswordHasher(PasswordHasher):
         """
         password_bytes = password.value.encode("utf-8")
         hash_bytes = password_hash.value.encode("utf-8")
-        return bcrypt.checkpw(password_bytes, hash_bytes)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _EXECUTOR, bcrypt.checkpw, password_bytes, hash_bytes
+        )
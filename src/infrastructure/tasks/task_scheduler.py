@@ -0,0 +1,43 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+from src.application.registration.ports.task_scheduler import TaskScheduler
+from src.infrastructure.logging.logger import getLogger
+
+logger = getLogger(__name__)
+
+
+class AsyncioTaskScheduler(TaskScheduler):
+    """In-process adapter running scheduled coroutines as asyncio tasks.
+
+    Tasks are lost if the process stops before they complete: swap this adapter for a
+    queue-backed one (Redis, RabbitMQ, ...) when delivery must be durable.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler with no pending task."""
+        # The event loop only keeps weak references to tasks, so hold strong ones
+        # until completion to prevent pending tasks from being garbage collected
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def schedule(self, coroutine: Coroutine[Any, Any, None]) -> None:
+        """Run a coroutine as an asyncio task without waiting for it.
+
+        Args:
+            coroutine: The coroutine to run in the background
+        """
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+
+    async def wait_for_pending(self) -> None:
+        """Wait for all scheduled tasks to complete (e.g. on app shutdown)."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _on_task_done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        # Nobody awaits the task: log its failure instead of losing it
+        if not task.cancelled() and (exception := task.exception()) is not None:
+            logger.error("Background task failed", exc_info=exception)
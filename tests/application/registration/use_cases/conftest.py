@@ -0,0 +1,55 @@
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.registration.ports.activation_code_repository import (
+    ActivationCodeRepository,
+)
+from src.application.registration.ports.user_repository import UserRepository
+from src.domain.user.entities.user import User
+from src.domain.user.entities.user import UserId
+from src.domain.user.entities.user import UserPublicId
+from src.domain.user.entities.user import UserStatus
+from src.domain.user.value_objects.password_hash import PasswordHash
+
+# Repository mocks are built once per test class (spec= introspects the port on
+# every construction) and reset after each test
+
+
+@pytest.fixture(scope="class")
+def mock_user_repository() -> MagicMock:
+    """Create a mock UserRepository."""
+    return MagicMock(spec=UserRepository)
+
+
+@pytest.fixture(scope="class")
+def mock_activation_code_repository() -> MagicMock:
+    """Create a mock ActivationCodeRepository."""
+    return MagicMock(spec=ActivationCodeRepository)
+
+
+@pytest.fixture(autouse=True)
+def reset_repository_mocks(
+    mock_user_repository: MagicMock,
+    mock_activation_code_repository: MagicMock,
+) -> Iterator[None]:
+    """Reset the class-scoped repository mocks, including their configured results."""
+    yield
+    mock_user_repository.reset_mock(return_value=True, side_effect=True)
+    mock_activation_code_repository.reset_mock(return_value=True, side_effect=True)
+
+
+# Entities are frozen dataclasses: tests share them across the class
+
+
+@pytest.fixture(scope="class")
+def sample_user() -> User:
+    """Create a sample User entity with PENDING status."""
+    return User(
+        id=UserId(1),
+        public_id=UserPublicId.generate(),
+        email="test@example.com",
+        password_hash=PasswordHash("$2b$12$hashedpassword"),
+        status=UserStatus.PENDING,
+    )
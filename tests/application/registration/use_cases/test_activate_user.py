@@ -1,15 +1,13 @@
+from collections.abc import Callable
+from collections.abc import Iterator
+from dataclasses import replace
 from datetime import UTC
 from datetime import datetime
-from datetime import timedelta
-from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
 import pytest
 
-from src.application.registration.ports.activation_code_repository import (
-    ActivationCodeRepository,
-)
-from src.application.registration.ports.user_repository import UserRepository
+from src.application.registration.ports.unit_of_work import UnitOfWork
 from src.application.registration.use_cases.activate_user import ActivateUser
 from src.domain.user.entities.activation_code import ActivationCode
 from src.domain.user.entities.activation_code import ActivationCodeStatus
@@ -22,45 +20,49 @@ from src.domain.user.errors import ActivationCodeNotFoundError
 from src.domain.user.errors import UserNotFoundError
 from src.domain.user.value_objects.password_hash import PasswordHash
 
+# Fixed expirations, far enough from the current time that the class-scoped
+# fixtures never go stale
+_FAR_FUTURE = datetime(2099, 1, 1, tzinfo=UTC)
+_PAST = datetime(2000, 1, 1, tzinfo=UTC)
+
 
 class TestActivateUserExecute:
     """Test ActivateUser.execute() method."""
 
-    @pytest.fixture
-    def mock_user_repository(self) -> MagicMock:
-        """Create a mock UserRepository."""
-        return MagicMock(spec=UserRepository)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_unit_of_work(cls) -> MagicMock:
+        """Create a mock UnitOfWork."""
+        return MagicMock(spec=UnitOfWork)
+
+    @pytest.fixture(autouse=True)
+    def reset_unit_of_work_mock(self, mock_unit_of_work: MagicMock) -> Iterator[None]:
+        """Reset the class-scoped unit of work mock.
 
-    @pytest.fixture
-    def mock_activation_code_repository(self) -> MagicMock:
-        """Create a mock ActivationCodeRepository."""
-        return MagicMock(spec=ActivationCodeRepository)
+        Return values are kept: __aexit__ must keep returning False so exceptions
+        raised inside the unit of work propagate.
+        """
+        yield
+        mock_unit_of_work.reset_mock(side_effect=True)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
+    @classmethod
     def activate_user(
-        self,
+        cls,
         mock_user_repository: MagicMock,
         mock_activation_code_repository: MagicMock,
+        mock_unit_of_work: MagicMock,
     ) -> ActivateUser:
         """Create ActivateUser instance with mocked dependencies."""
         return ActivateUser(
             user_repository=mock_user_repository,
             activation_code_repository=mock_activation_code_repository,
+            unit_of_work=mock_unit_of_work,
         )
 
-    @pytest.fixture
-    def sample_user_pending(self) -> User:
-        """Create a sample User entity with PENDING status."""
-        return User(
-            id=UserId(1),
-            public_id=UserPublicId.generate(),
-            email="test@example.com",
-            password_hash=PasswordHash("$2b$12$hashedpassword"),
-            status=UserStatus.PENDING,
-        )
-
-    @pytest.fixture
-    def sample_user_active(self) -> User:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_user_active(cls) -> User:
         """Create a sample User entity with ACTIVE status."""
         return User(
             id=UserId(1),
@@ -70,41 +72,41 @@ class TestActivateUserExecute:
             status=UserStatus.ACTIVE,
         )
 
-    @pytest.fixture
-    def valid_activation_code(self, sample_user_pending: User) -> ActivationCode:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def activated_user(cls, sample_user: User) -> User:
+        """Create the ACTIVE counterpart of the sample pending user."""
+        return replace(sample_user, status=UserStatus.ACTIVE)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def valid_activation_code(cls, sample_user: User) -> ActivationCode:
         """Create a valid activation code."""
         return ActivationCode(
-            user_id=sample_user_pending.id,
+            user_id=sample_user.id,
             code="1234",
-            expires_at=datetime.now(UTC) + timedelta(minutes=1),
+            expires_at=_FAR_FUTURE,
             status=ActivationCodeStatus.PENDING,
         )
 
-    async def test_execute_activates_user_successfully(
+    async def test_execute_activates_user_successfully(  # noqa: PLR0913
         self,
         activate_user: ActivateUser,
         mock_user_repository: MagicMock,
         mock_activation_code_repository: MagicMock,
-        sample_user_pending: User,
+        sample_user: User,
+        activated_user: User,
         valid_activation_code: ActivationCode,
     ) -> None:
         """Test that execute() successfully activates a user."""
-        user_id = sample_user_pending.id
+        user_id = sample_user.id
         code = "1234"
-        activated_user = User(
-            id=sample_user_pending.id,
-            public_id=sample_user_pending.public_id,
-            email=sample_user_pending.email,
-            password_hash=sample_user_pending.password_hash,
-            status=UserStatus.ACTIVE,
-        )
 
         # Setup mocks
-        mock_activation_code_repository.find_by_user_id_and_code = AsyncMock(
-            return_value=valid_activation_code
+        mock_activation_code_repository.find_by_user_id_and_code.return_value = (
+            valid_activation_code
         )
-        mock_user_repository.set_status = AsyncMock(return_value=activated_user)
-        mock_activation_code_repository.mark_as_used = AsyncMock()
+        mock_user_repository.set_status.return_value = activated_user
 
         # Execute
         result = await activate_user.execute(user_id, code)
@@ -116,12 +118,12 @@ class TestActivateUserExecute:
 
         # Verify user status was updated
         mock_user_repository.set_status.assert_called_once_with(
-            sample_user_pending.id, UserStatus.ACTIVE
+            sample_user.id, UserStatus.ACTIVE
         )
 
         # Verify activation code was marked as used
         mock_activation_code_repository.mark_as_used.assert_called_once_with(
-            sample_user_pending.id
+            sample_user.id
         )
 
         # Verify returned user is activated
@@ -133,19 +135,19 @@ class TestActivateUserExecute:
         activate_user: ActivateUser,
         mock_user_repository: MagicMock,
         mock_activation_code_repository: MagicMock,
-        sample_user_pending: User,
+        sample_user: User,
         valid_activation_code: ActivationCode,
     ) -> None:
         """Test that execute() raises UserNotFoundError when user not found."""
-        user_id = sample_user_pending.id
+        user_id = sample_user.id
         code = "1234"
 
         # Setup mocks
-        mock_activation_code_repository.find_by_user_id_and_code = AsyncMock(
-            return_value=valid_activation_code
+        mock_activation_code_repository.find_by_user_id_and_code.return_value = (
+            valid_activation_code
         )
-        mock_user_repository.set_status = AsyncMock(
-            side_effect=UserNotFoundError("User not found.")
+        mock_user_repository.set_status.side_effect = UserNotFoundError(
+            "User not found."
         )
 
         # Execute and verify exception
@@ -162,7 +164,7 @@ class TestActivateUserExecute:
             user_id, UserStatus.ACTIVE
         )
 
-        # Verify activation code was not marked as used (since status update failed)
+        # Verify activation code was not marked as used
         mock_activation_code_repository.mark_as_used.assert_not_called()
 
     async def test_execute_raises_invalid_code_error_when_code_not_found(
@@ -170,15 +172,15 @@ class TestActivateUserExecute:
         activate_user: ActivateUser,
         mock_user_repository: MagicMock,
         mock_activation_code_repository: MagicMock,
-        sample_user_pending: User,
+        sample_user: User,
     ) -> None:
-        """Test that execute() raises ActivationCodeNotFoundError when code not found."""
-        user_id = sample_user_pending.id
+        """Test that execute() raises ActivationCodeNotFoundError for a wrong code."""
+        user_id = sample_user.id
         code = "1234"
 
         # Setup mocks
-        mock_activation_code_repository.find_by_user_id_and_code = AsyncMock(
-            side_effect=ActivationCodeNotFoundError()
+        mock_activation_code_repository.find_by_user_id_and_code.side_effect = (
+            ActivationCodeNotFoundError()
         )
 
         # Execute and verify exception
@@ -190,101 +192,47 @@ class TestActivateUserExecute:
             user_id, code
         )
 
-        # Verify user status was not updated
-        mock_user_repository.set_status.assert_not_called()
-
-        # Verify activation code was not marked as used
-        mock_activation_code_repository.mark_as_used.assert_not_called()
-
-    async def test_execute_raises_invalid_code_error_for_expired_code(
-        self,
-        activate_user: ActivateUser,
-        mock_user_repository: MagicMock,
-        mock_activation_code_repository: MagicMock,
-        sample_user_pending: User,
-    ) -> None:
-        """Test that execute() raises ActivationCodeInvalidError for expired code."""
-        user_id = sample_user_pending.id
-        code = "1234"
-        expired_code = ActivationCode.model_construct(
-            user_id=user_id,
-            code=code,
-            expires_at=datetime.now(UTC) - timedelta(minutes=1),
-            status=ActivationCodeStatus.PENDING,
-        )
-
-        # Setup mocks
-        mock_activation_code_repository.find_by_user_id_and_code = AsyncMock(
-            return_value=expired_code
-        )
-
-        # Execute and verify exception
-        with pytest.raises(ActivationCodeInvalidError):
-            await activate_user.execute(user_id, code)
-
-        # Verify user status was not updated
+        # Verify user was not activated
         mock_user_repository.set_status.assert_not_called()
-
-        # Verify activation code was not marked as used
         mock_activation_code_repository.mark_as_used.assert_not_called()
 
-    async def test_execute_raises_invalid_code_error_for_used_code(
+    @pytest.mark.parametrize(
+        ("expires_at", "status"),
+        [
+            pytest.param(_PAST, ActivationCodeStatus.PENDING, id="expired_code"),
+            pytest.param(_FAR_FUTURE, ActivationCodeStatus.USED, id="used_code"),
+        ],
+    )
+    async def test_execute_raises_invalid_code_error(  # noqa: PLR0913
         self,
         activate_user: ActivateUser,
         mock_user_repository: MagicMock,
         mock_activation_code_repository: MagicMock,
-        sample_user_pending: User,
+        sample_user: User,
+        expires_at: datetime,
+        status: ActivationCodeStatus,
     ) -> None:
-        """Test that execute() raises ActivationCodeInvalidError for used code."""
-        user_id = sample_user_pending.id
-        code = "1234"
-        used_code = ActivationCode(
-            user_id=user_id,
-            code=code,
-            expires_at=datetime.now(UTC) + timedelta(minutes=1),
-            status=ActivationCodeStatus.USED,
-        )
+        """Test that execute() raises ActivationCodeInvalidError for unusable codes."""
+        user_id = sample_user.id
 
         # Setup mocks
-        mock_activation_code_repository.find_by_user_id_and_code = AsyncMock(
-            return_value=used_code
+        mock_activation_code_repository.find_by_user_id_and_code.return_value = (
+            ActivationCode(
+                user_id=user_id,
+                code="1234",
+                expires_at=expires_at,
+                status=status,
+            )
         )
 
         # Execute and verify exception
         with pytest.raises(ActivationCodeInvalidError):
-            await activate_user.execute(user_id, code)
+            await activate_user.execute(user_id, "1234")
 
-        # Verify user status was not updated
+        # Verify user was not activated
         mock_user_repository.set_status.assert_not_called()
-
-        # Verify activation code was not marked as used again
         mock_activation_code_repository.mark_as_used.assert_not_called()
 
-    async def test_execute_raises_invalid_code_error_for_wrong_code(
-        self,
-        activate_user: ActivateUser,
-        mock_user_repository: MagicMock,
-        mock_activation_code_repository: MagicMock,
-        sample_user_pending: User,
-    ) -> None:
-        """Test that execute() raises ActivationCodeNotFoundError for wrong code.
-
-        Note: The repository's find_by_user_id_and_code method raises
-        ActivationCodeNotFoundError when the code doesn't match.
-        """
-        user_id = sample_user_pending.id
-        wrong_code = "9999"
-
-        # Setup mocks
-        # Repository raises error when code doesn't match
-        mock_activation_code_repository.find_by_user_id_and_code = AsyncMock(
-            side_effect=ActivationCodeNotFoundError()
-        )
-
-        # Execute and verify exception
-        with pytest.raises(ActivationCodeNotFoundError):
-            await activate_user.execute(user_id, wrong_code)
-
     async def test_execute_is_idempotent_when_user_already_active(
         self,
         activate_user: ActivateUser,
@@ -298,17 +246,16 @@ class TestActivateUserExecute:
         valid_activation_code = ActivationCode(
             user_id=user_id,
             code=code,
-            expires_at=datetime.now(UTC) + timedelta(minutes=1),
+            expires_at=_FAR_FUTURE,
             status=ActivationCodeStatus.PENDING,
         )
 
         # Setup mocks
-        mock_activation_code_repository.find_by_user_id_and_code = AsyncMock(
-            return_value=valid_activation_code
+        mock_activation_code_repository.find_by_user_id_and_code.return_value = (
+            valid_activation_code
         )
-        # User status update returns the same active user
-        mock_user_repository.set_status = AsyncMock(return_value=sample_user_active)
-        mock_activation_code_repository.mark_as_used = AsyncMock()
+        # Status update returns the same active user
+        mock_user_repository.set_status.return_value = sample_user_active
 
         # Execute
         result = await activate_user.execute(user_id, code)
@@ -318,61 +265,102 @@ class TestActivateUserExecute:
             user_id, code
         )
 
-        # Verify user status was updated (even if already active, for idempotency)
+        # Verify status was set (even if already active, for idempotency)
         mock_user_repository.set_status.assert_called_once_with(
             user_id, UserStatus.ACTIVE
         )
 
-        # Verify activation code was marked as used
-        mock_activation_code_repository.mark_as_used.assert_called_once_with(user_id)
-
         # Verify returned user is the same active user
         assert result == sample_user_active
         assert result.status == UserStatus.ACTIVE
 
-    async def test_execute_marks_activation_code_as_used(
+    async def test_execute_marks_activation_code_as_used(  # noqa: PLR0913
         self,
         activate_user: ActivateUser,
         mock_user_repository: MagicMock,
         mock_activation_code_repository: MagicMock,
-        sample_user_pending: User,
+        sample_user: User,
+        activated_user: User,
         valid_activation_code: ActivationCode,
     ) -> None:
         """Test that execute() marks activation code as used after successful activation."""
-        user_id = sample_user_pending.id
+        user_id = sample_user.id
         code = "1234"
-        activated_user = User(
-            id=sample_user_pending.id,
-            public_id=sample_user_pending.public_id,
-            email=sample_user_pending.email,
-            password_hash=sample_user_pending.password_hash,
-            status=UserStatus.ACTIVE,
-        )
 
         # Setup mocks
-        mock_activation_code_repository.find_by_user_id_and_code = AsyncMock(
-            return_value=valid_activation_code
+        mock_activation_code_repository.find_by_user_id_and_code.return_value = (
+            valid_activation_code
         )
-        mock_user_repository.set_status = AsyncMock(return_value=activated_user)
-        mock_activation_code_repository.mark_as_used = AsyncMock()
+        mock_user_repository.set_status.return_value = activated_user
 
         # Execute
         await activate_user.execute(user_id, code)
 
         # Verify activation code was marked as used
         mock_activation_code_repository.mark_as_used.assert_called_once_with(
-            sample_user_pending.id
+            sample_user.id
+        )
+
+        # Verify both writes happened exactly once
+        assert mock_user_repository.set_status.call_count == 1
+        assert mock_activation_code_repository.mark_as_used.call_count == 1
+
+    async def test_execute_writes_inside_unit_of_work(  # noqa: PLR0913
+        self,
+        activate_user: ActivateUser,
+        mock_user_repository: MagicMock,
+        mock_activation_code_repository: MagicMock,
+        mock_unit_of_work: MagicMock,
+        activated_user: User,
+        valid_activation_code: ActivationCode,
+    ) -> None:
+        """Test that both activation writes run inside the unit of work."""
+        calls: list[str] = []
+
+        def record(name: str, result: object = None) -> Callable[..., object]:
+            """Build a side effect recording the call before returning result."""
+
+            def side_effect(*_: object) -> object:
+                calls.append(name)
+                return result
+
+            return side_effect
+
+        # Setup mocks recording the order of operations
+        mock_activation_code_repository.find_by_user_id_and_code.return_value = (
+            valid_activation_code
+        )
+        mock_unit_of_work.__aenter__.side_effect = record("begin")
+        mock_unit_of_work.__aexit__.side_effect = record("end", False)
+        mock_user_repository.set_status.side_effect = record(
+            "set_status", activated_user
         )
+        mock_activation_code_repository.mark_as_used.side_effect = record(
+            "mark_as_used"
+        )
+
+        # Execute
+        await activate_user.execute(activated_user.id, "1234")
+
+        # Verify writes happened between begin and end of the unit of work
+        assert calls == ["begin", "set_status", "mark_as_used", "end"]
+
+    async def test_execute_does_not_start_unit_of_work_for_unknown_code(
+        self,
+        activate_user: ActivateUser,
+        mock_activation_code_repository: MagicMock,
+        mock_unit_of_work: MagicMock,
+        sample_user: User,
+    ) -> None:
+        """Test that no transaction is opened when the code is rejected."""
+        # Setup mocks
+        mock_activation_code_repository.find_by_user_id_and_code.side_effect = (
+            ActivationCodeNotFoundError()
+        )
+
+        # Execute and verify exception
+        with pytest.raises(ActivationCodeNotFoundError):
+            await activate_user.execute(sample_user.id, "9999")
 
-        # Verify order: status update happens before marking code as used
-        # (This is important for transaction consistency)
-        call_order = [
-            call[0] for call in mock_user_repository.set_status.call_args_list
-        ]
-        mark_used_calls = [
-            call[0]
-            for call in mock_activation_code_repository.mark_as_used.call_args_list
-        ]
-        # Both should be called
-        assert len(call_order) == 1
-        assert len(mark_used_calls) == 1
+        # Verify unit of work was not entered
+        mock_unit_of_work.__aenter__.assert_not_called()
@@ -1,83 +1,91 @@
-from unittest.mock import AsyncMock
+from collections.abc import Coroutine
+from collections.abc import Iterator
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
-from src.application.registration.ports.activation_code_repository import (
-    ActivationCodeRepository,
-)
 from src.application.registration.ports.email_service import EmailService
-from src.application.registration.ports.user_repository import UserRepository
+from src.application.registration.ports.task_scheduler import TaskScheduler
 from src.application.registration.use_cases.issue_activation_code import (
     IssueActivationCode,
 )
 from src.domain.user.entities.activation_code import ActivationCode
 from src.domain.user.entities.user import User
 from src.domain.user.entities.user import UserId
-from src.domain.user.entities.user import UserPublicId
-from src.domain.user.entities.user import UserStatus
 from src.domain.user.errors import UserNotFoundError
-from src.domain.user.value_objects.password_hash import PasswordHash
+
+
+def _close(coroutine: Coroutine[Any, Any, Any]) -> None:
+    """Close a scheduled coroutine so it is not reported as never awaited."""
+    coroutine.close()
 
 
 class TestIssueActivationCodeExecute:
     """Test IssueActivationCode.execute() method."""
 
-    @pytest.fixture
-    def mock_user_repository(self) -> MagicMock:
-        """Create a mock UserRepository."""
-        return MagicMock(spec=UserRepository)
-
-    @pytest.fixture
-    def mock_activation_code_repository(self) -> MagicMock:
-        """Create a mock ActivationCodeRepository."""
-        return MagicMock(spec=ActivationCodeRepository)
+    # Mocks are built once per class (spec= introspects the port on every
+    # construction) and reset after each test, like the repository mocks
 
-    @pytest.fixture
-    def mock_email_service(self) -> MagicMock:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_email_service(cls) -> MagicMock:
         """Create a mock EmailService."""
         return MagicMock(spec=EmailService)
 
-    @pytest.fixture
-    def issue_activation_code(
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_task_scheduler(cls) -> MagicMock:
+        """Create a mock TaskScheduler discarding scheduled coroutines."""
+        mock_task_scheduler = MagicMock(spec=TaskScheduler)
+        mock_task_scheduler.schedule.side_effect = _close
+        return mock_task_scheduler
+
+    @pytest.fixture(autouse=True)
+    def reset_service_mocks(
         self,
+        mock_email_service: MagicMock,
+        mock_task_scheduler: MagicMock,
+    ) -> Iterator[None]:
+        """Reset the class-scoped service mocks.
+
+        The task scheduler keeps its side effect closing scheduled coroutines.
+        """
+        yield
+        mock_email_service.reset_mock(return_value=True, side_effect=True)
+        mock_task_scheduler.reset_mock()
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def issue_activation_code(
+        cls,
         mock_user_repository: MagicMock,
         mock_activation_code_repository: MagicMock,
         mock_email_service: MagicMock,
+        mock_task_scheduler: MagicMock,
     ) -> IssueActivationCode:
         """Create IssueActivationCode instance with mocked dependencies."""
         return IssueActivationCode(
             user_repository=mock_user_repository,
             activation_code_repository=mock_activation_code_repository,
             email_service=mock_email_service,
+            task_scheduler=mock_task_scheduler,
         )
 
-    @pytest.fixture
-    def sample_user(self) -> User:
-        """Create a sample User entity for testing."""
-        return User(
-            id=UserId(1),
-            public_id=UserPublicId.generate(),
-            email="test@example.com",
-            password_hash=PasswordHash("$2b$12$hashedpassword"),
-            status=UserStatus.PENDING,
-        )
-
-    async def test_execute_issues_activation_code_successfully(
+    async def test_execute_issues_activation_code_successfully(  # noqa: PLR0913
         self,
         issue_activation_code: IssueActivationCode,
         mock_user_repository: MagicMock,
         mock_activation_code_repository: MagicMock,
         mock_email_service: MagicMock,
+        mock_task_scheduler: MagicMock,
         sample_user: User,
     ) -> None:
         """Test that execute() successfully issues an activation code."""
         user_id = sample_user.id
 
         # Setup mocks
-        mock_user_repository.find_by_id = AsyncMock(return_value=sample_user)
-        mock_activation_code_repository.save = AsyncMock()
-        mock_email_service.send_activation_code = AsyncMock()
+        mock_user_repository.find_by_id.return_value = sample_user
 
         # Execute
         result = await issue_activation_code.execute(user_id)
@@ -93,10 +101,11 @@ class TestIssueActivationCodeExecute:
         assert len(saved_activation_code.code) == 4  # noqa: PLR2004
         assert saved_activation_code.code.isdigit()
 
-        # Verify email was sent with activation code
+        # Verify email was scheduled in the background with activation code
         mock_email_service.send_activation_code.assert_called_once_with(
             sample_user.email, saved_activation_code.code
         )
+        mock_task_scheduler.schedule.assert_called_once()
 
         # Verify returned user
         assert result == sample_user
@@ -107,13 +116,14 @@ class TestIssueActivationCodeExecute:
         mock_user_repository: MagicMock,
         mock_activation_code_repository: MagicMock,
         mock_email_service: MagicMock,
+        mock_task_scheduler: MagicMock,
     ) -> None:
         """Test that execute() raises UserNotFoundError when user not found."""
         user_id = UserId(999)
 
         # Setup mocks
-        mock_user_repository.find_by_id = AsyncMock(
-            side_effect=UserNotFoundError("User not found.")
+        mock_user_repository.find_by_id.side_effect = UserNotFoundError(
+            "User not found."
         )
 
         # Execute and verify exception
@@ -128,86 +138,31 @@ class TestIssueActivationCodeExecute:
 
         # Verify email was not sent
         mock_email_service.send_activation_code.assert_not_called()
+        mock_task_scheduler.schedule.assert_not_called()
 
-    async def test_execute_creates_activation_code_with_correct_user_id(
-        self,
-        mock_user_repository: MagicMock,
-        mock_activation_code_repository: MagicMock,
-        mock_email_service: MagicMock,
-        sample_user: User,
-    ) -> None:
-        """Test that activation code is created with the correct user ID."""
-        user_id = sample_user.id
-
-        # Setup mocks
-        mock_user_repository.find_by_id = AsyncMock(return_value=sample_user)
-        mock_activation_code_repository.save = AsyncMock()
-        mock_email_service.send_activation_code = AsyncMock()
-
-        # Create IssueActivationCode instance
-        issue_activation_code = IssueActivationCode(
-            user_repository=mock_user_repository,
-            activation_code_repository=mock_activation_code_repository,
-            email_service=mock_email_service,
-        )
-
-        # Execute
-        await issue_activation_code.execute(user_id)
-
-        # Verify activation code was created with correct user ID
-        saved_activation_code = mock_activation_code_repository.save.call_args[0][0]
-        assert saved_activation_code.user_id == sample_user.id
-
-    async def test_execute_sends_email_with_activation_code(
+    async def test_execute_does_not_send_email_when_save_fails(  # noqa: PLR0913
         self,
         issue_activation_code: IssueActivationCode,
         mock_user_repository: MagicMock,
         mock_activation_code_repository: MagicMock,
         mock_email_service: MagicMock,
+        mock_task_scheduler: MagicMock,
         sample_user: User,
     ) -> None:
-        """Test that email is sent with the generated activation code."""
-        user_id = sample_user.id
-
+        """Test that no email is scheduled when the activation code cannot be saved."""
         # Setup mocks
-        mock_user_repository.find_by_id = AsyncMock(return_value=sample_user)
-        mock_activation_code_repository.save = AsyncMock()
-        mock_email_service.send_activation_code = AsyncMock()
-
-        # Execute
-        await issue_activation_code.execute(user_id)
-
-        # Verify email was sent with the activation code
-        mock_email_service.send_activation_code.assert_called_once()
-        call_args = mock_email_service.send_activation_code.call_args
-        assert call_args[0][0] == sample_user.email
-        assert len(call_args[0][1]) == 4  # noqa: PLR2004 - Activation code is 4 digits
-        assert call_args[0][1].isdigit()
-
-    async def test_execute_returns_user(
-        self,
-        issue_activation_code: IssueActivationCode,
-        mock_user_repository: MagicMock,
-        mock_activation_code_repository: MagicMock,
-        mock_email_service: MagicMock,
-        sample_user: User,
-    ) -> None:
-        """Test that execute() returns the user entity."""
-        user_id = sample_user.id
-
-        # Setup mocks
-        mock_user_repository.find_by_id = AsyncMock(return_value=sample_user)
-        mock_activation_code_repository.save = AsyncMock()
-        mock_email_service.send_activation_code = AsyncMock()
+        mock_user_repository.find_by_id.return_value = sample_user
+        mock_activation_code_repository.save.side_effect = RuntimeError(
+            "Database unavailable"
+        )
 
-        # Execute
-        result = await issue_activation_code.execute(user_id)
+        # Execute and verify exception
+        with pytest.raises(RuntimeError, match="Database unavailable"):
+            await issue_activation_code.execute(sample_user.id)
 
-        # Verify returned user
-        assert result == sample_user
-        assert result.id == sample_user.id
-        assert result.email == sample_user.email
-        assert result.status == sample_user.status
+        # Verify email was not scheduled
+        mock_email_service.send_activation_code.assert_not_called()
+        mock_task_scheduler.schedule.assert_not_called()
 
     async def test_execute_creates_new_activation_code_each_time(
         self,
@@ -221,9 +176,7 @@ class TestIssueActivationCodeExecute:
         user_id = sample_user.id
 
         # Setup mocks
-        mock_user_repository.find_by_id = AsyncMock(return_value=sample_user)
-        mock_activation_code_repository.save = AsyncMock()
-        mock_email_service.send_activation_code = AsyncMock()
+        mock_user_repository.find_by_id.return_value = sample_user
 
         # Execute twice
         await issue_activation_code.execute(user_id)
@@ -1,14 +1,10 @@
-from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
 import pytest
 
 from src.application.registration.ports.password_hasher import PasswordHasher
-from src.application.registration.ports.user_repository import UserRepository
 from src.application.registration.use_cases.register_user import RegisterUser
 from src.domain.user.entities.user import User
-from src.domain.user.entities.user import UserId
-from src.domain.user.entities.user import UserPublicId
 from src.domain.user.entities.user import UserStatus
 from src.domain.user.errors import UserAlreadyExistsError
 from src.domain.user.value_objects.password import Password
@@ -18,11 +14,6 @@ from src.domain.user.value_objects.password_hash import PasswordHash
 class TestRegisterUserExecute:
     """Test RegisterUser.execute() method."""
 
-    @pytest.fixture
-    def mock_user_repository(self) -> MagicMock:
-        """Create a mock UserRepository."""
-        return MagicMock(spec=UserRepository)
-
     @pytest.fixture
     def mock_password_hasher(self) -> MagicMock:
         """Create a mock PasswordHasher."""
@@ -40,17 +31,6 @@ class TestRegisterUserExecute:
             password_hasher=mock_password_hasher,
         )
 
-    @pytest.fixture
-    def sample_user(self) -> User:
-        """Create a sample User entity for testing."""
-        return User(
-            id=UserId(1),
-            public_id=UserPublicId.generate(),
-            email="test@example.com",
-            password_hash=PasswordHash("$2b$12$hashedpassword"),
-            status=UserStatus.PENDING,
-        )
-
     async def test_execute_creates_user_successfully(
         self,
         register_user: RegisterUser,
@@ -65,7 +45,7 @@ class TestRegisterUserExecute:
 
         # Setup mocks
         mock_password_hasher.hash.return_value = password_hash
-        mock_user_repository.create = AsyncMock(return_value=sample_user)
+        mock_user_repository.create.return_value = sample_user
 
         # Execute
         result = await register_user.execute(email, password)
@@ -94,8 +74,8 @@ class TestRegisterUserExecute:
 
         # Setup mocks
         mock_password_hasher.hash.return_value = password_hash
-        mock_user_repository.create = AsyncMock(
-            side_effect=UserAlreadyExistsError("User already exists.")
+        mock_user_repository.create.side_effect = UserAlreadyExistsError(
+            "User already exists."
         )
 
         # Execute and verify exception
@@ -141,7 +121,7 @@ class TestRegisterUserExecute:
 
         # Setup mocks
         mock_password_hasher.hash.return_value = password_hash
-        mock_user_repository.create = AsyncMock(return_value=sample_user)
+        mock_user_repository.create.return_value = sample_user
 
         # Execute
         result = await register_user.execute(email, password)
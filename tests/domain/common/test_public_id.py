@@ -59,6 +59,19 @@ class TestPublicIdGenerate:
         assert id1.uuid_v7 != id2.uuid_v7
 
 
+class TestPublicIdFromUuid:
+    """Test PublicId.from_uuid() classmethod."""
+
+    def test_from_uuid_uses_class_prefix(self) -> None:
+        """Test that from_uuid() builds a PublicId with the class prefix."""
+        uuid = uuid7()
+        public_id = UserPublicId.from_uuid(uuid)
+
+        assert isinstance(public_id, UserPublicId)
+        assert public_id == UserPublicId(prefix="usr", uuid_v7=uuid)
+        assert str(public_id) == f"usr_{uuid}"
+
+
 class TestPublicIdFromString:
     """Test PublicId.from_string() classmethod."""
 
@@ -99,6 +112,16 @@ class TestPublicIdFromString:
         with pytest.raises(ValueError, match="Invalid UserPublicId format"):
             UserPublicId.from_string(value)
 
+    def test_from_string_with_non_canonical_uuid_raises_value_error(self) -> None:
+        """Test that UUID forms other than the canonical hyphenated one are rejected."""
+        uuid = uuid7()
+
+        with pytest.raises(ValueError, match="Invalid UserPublicId format"):
+            UserPublicId.from_string(f"usr_{{{uuid}}}")
+
+        with pytest.raises(ValueError, match="Invalid UserPublicId format"):
+            UserPublicId.from_string(f"usr_{uuid.hex}")
+
     def test_from_string_with_missing_separator_raises_value_error(self) -> None:
         """Test that missing separator raises ValueError."""
         value = "usr123456"
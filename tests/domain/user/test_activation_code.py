@@ -1,9 +1,9 @@
+from dataclasses import FrozenInstanceError
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
 
 import pytest
-from pydantic import ValidationError
 
 from src.domain.user.entities.activation_code import ActivationCode
 from src.domain.user.entities.activation_code import ActivationCodeStatus
@@ -24,16 +24,12 @@ class TestActivationCodeFieldValidation:
         assert code.code == "0123"
 
         # Too short (3 characters)
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError, match="exactly 4 characters"):
             ActivationCode(user_id=user_id, code="123", expires_at=expires_at)
-        error_str = str(exc_info.value).lower()
-        assert "at least 4 characters" in error_str or "string_too_short" in error_str
 
         # Too long (5 characters)
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError, match="exactly 4 characters"):
             ActivationCode(user_id=user_id, code="12345", expires_at=expires_at)
-        error_str = str(exc_info.value).lower()
-        assert "at most 4 characters" in error_str or "string_too_long" in error_str
 
     def test_expires_at_can_be_in_past(self) -> None:
         """Test that expires_at can be in the past (for loading expired codes from DB).
@@ -50,7 +46,7 @@ class TestActivationCodeFieldValidation:
 
         # Past time can be created (needed for loading expired codes from database)
         past_time = datetime.now(UTC) - timedelta(minutes=1)
-        expired_code = ActivationCode.model_construct(
+        expired_code = ActivationCode(
             user_id=user_id,
             code="1234",
             expires_at=past_time,
@@ -89,11 +85,38 @@ class TestActivationCodeFieldValidation:
 
         code = ActivationCode(user_id=user_id, code="1234", expires_at=expires_at)
 
-        # Attempting to modify should raise an error (Pydantic raises ValidationError for frozen models)
-        with pytest.raises((ValidationError, AttributeError)):
+        # Attempting to modify should raise an error
+        with pytest.raises(FrozenInstanceError):
             code.code = "5678"  # type: ignore[misc]
 
 
+class TestActivationCodeValidateCodeFormat:
+    """Test ActivationCode.validate_code_format() static method."""
+
+    def test_accepts_4_digit_codes(self) -> None:
+        """Test that 4-digit codes are accepted and returned unchanged."""
+        assert ActivationCode.validate_code_format("0000") == "0000"
+        assert ActivationCode.validate_code_format("0123") == "0123"
+        assert ActivationCode.validate_code_format("9999") == "9999"
+
+    def test_rejects_non_digit_codes(self) -> None:
+        """Test that codes with characters other than ASCII digits are rejected."""
+        with pytest.raises(ValueError, match="only digits"):
+            ActivationCode.validate_code_format("12a4")
+
+        # "١٢٣٤" is 1234 in Arabic-Indic digits
+        with pytest.raises(ValueError, match="only digits"):
+            ActivationCode.validate_code_format("١٢٣٤")
+
+    def test_rejects_codes_of_wrong_length(self) -> None:
+        """Test that digit codes of the wrong length are rejected."""
+        with pytest.raises(ValueError, match="exactly 4 digits"):
+            ActivationCode.validate_code_format("123")
+
+        with pytest.raises(ValueError, match="exactly 4 digits"):
+            ActivationCode.validate_code_format("12345")
+
+
 class TestActivationCodeGenerateCode:
     """Test ActivationCode.generate_code() static method."""
 
@@ -182,8 +205,8 @@ class TestActivationCodeIsExpired:
         user_id = UserId(1)
         expires_at = datetime.now(UTC) - timedelta(minutes=1)
 
-        # Create a code with past time using model_construct to bypass validation
-        expired_code = ActivationCode.model_construct(
+        # Create a code with past time
+        expired_code = ActivationCode(
             user_id=user_id,
             code="1234",
             expires_at=expires_at,
@@ -197,7 +220,7 @@ class TestActivationCodeIsExpired:
         # Use a time very close to now, but slightly in the past
         expires_at = datetime.now(UTC) - timedelta(seconds=1)
 
-        expired_code = ActivationCode.model_construct(
+        expired_code = ActivationCode(
             user_id=user_id,
             code="1234",
             expires_at=expires_at,
@@ -271,7 +294,7 @@ class TestActivationCodeIsValid:
         user_id = UserId(1)
         expires_at = datetime.now(UTC) - timedelta(minutes=1)
 
-        expired_code = ActivationCode.model_construct(
+        expired_code = ActivationCode(
             user_id=user_id,
             code="1234",
             expires_at=expires_at,
@@ -285,12 +308,12 @@ class TestActivationCodeIsValid:
         user_id = UserId(1)
         expires_at = datetime.now(UTC) - timedelta(minutes=1)
 
-        expired_code = ActivationCode.model_construct(
+        expired_code = ActivationCode(
             user_id=user_id,
             code="1234",
             expires_at=expires_at,
             status=ActivationCodeStatus.USED,
         )
-        # Should raise error for used code first (checked before expired)
-        with pytest.raises(ActivationCodeInvalidError, match="already been used"):
+        # Should raise error for expired code first (checked before used)
+        with pytest.raises(ActivationCodeInvalidError, match="expired"):
             expired_code.is_valid()
@@ -46,6 +46,17 @@ class TestPasswordMaxLength:
         error_messages = [str(e) for e in exc_info.value.exceptions]
         assert any("at most 128 characters" in msg for msg in error_messages)
 
+    def test_password_too_long_is_rejected_before_other_checks(self) -> None:
+        """Test that an oversized password only reports the max length error."""
+        # No uppercase, digit or special character either
+        with pytest.raises(
+            ExceptionGroup, match="Password validation failed"
+        ) as exc_info:
+            Password("a" * 10_000)
+
+        error_messages = [str(e) for e in exc_info.value.exceptions]
+        assert error_messages == ["Password must be at most 128 characters long"]
+
     def test_password_exactly_max_length_passes(self) -> None:
         """Test that password with exactly MAX_LENGTH passes."""
         # Create a password that's exactly 128 characters
@@ -113,6 +124,12 @@ class TestPasswordRequiresDigit:
         password = Password("ValidPass123!")
         assert password.value == "ValidPass123!"
 
+    def test_password_with_non_ascii_digit_passes(self) -> None:
+        """Test that a non-ASCII decimal digit satisfies the digit requirement."""
+        # "٣" is 3 in Arabic-Indic digits
+        password = Password("ValidPass٣!")
+        assert password.value == "ValidPass٣!"
+
 
 class TestPasswordRequiresSpecialChar:
     """Test Password REQUIRES_SPECIAL_CHAR validation."""
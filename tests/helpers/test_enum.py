@@ -0,0 +1,75 @@
+from enum import Enum
+from enum import IntEnum
+from enum import StrEnum
+
+from src.helpers.enum import EnumHelper
+
+
+class FirstStrEnum(StrEnum):
+    A = "a"
+    B = "b"
+
+
+class SecondStrEnum(StrEnum):
+    C = "c"
+
+
+class NumberEnum(IntEnum):
+    ONE = 1
+
+
+class TestEnumHelperMerge:
+    """Test EnumHelper.merge() static method."""
+
+    def test_merge_combines_members_of_all_enums(self) -> None:
+        """Test that the merged enum has the members of every input enum."""
+        merged = EnumHelper.merge("MergedMembers", FirstStrEnum, SecondStrEnum)
+
+        assert [(member.name, member.value) for member in merged] == [  # type: ignore[attr-defined]
+            ("A", "a"),
+            ("B", "b"),
+            ("C", "c"),
+        ]
+
+    def test_merge_str_enums_returns_str_enum(self) -> None:
+        """Test that merging only StrEnums produces a StrEnum."""
+        merged = EnumHelper.merge("MergedStr", FirstStrEnum, SecondStrEnum)
+
+        assert issubclass(merged, StrEnum)  # type: ignore[arg-type]
+
+    def test_merge_mixed_enums_returns_enum(self) -> None:
+        """Test that merging non-StrEnums produces a plain Enum."""
+        merged = EnumHelper.merge("MergedMixed", FirstStrEnum, NumberEnum)
+
+        assert issubclass(merged, Enum)  # type: ignore[arg-type]
+        assert not issubclass(merged, StrEnum)  # type: ignore[arg-type]
+
+
+class TestEnumHelperMergeToSource:
+    """Test EnumHelper.merge_to_source() static method."""
+
+    def test_merge_to_source_renders_class_statement(self) -> None:
+        """Test that the generated source defines the merged enum literally."""
+        source = EnumHelper.merge_to_source("Merged", FirstStrEnum, SecondStrEnum)
+
+        assert source == (
+            "from enum import StrEnum\n"
+            "\n"
+            "\n"
+            "class Merged(StrEnum):\n"
+            '    A = "a"\n'
+            '    B = "b"\n'
+            '    C = "c"\n'
+        )
+
+    def test_merge_to_source_matches_merge(self) -> None:
+        """Test that executing the generated source yields the merged members."""
+        source = EnumHelper.merge_to_source("Merged", FirstStrEnum, NumberEnum)
+        namespace: dict[str, type[Enum]] = {}
+        exec(source, namespace)  # noqa: S102
+        generated = namespace["Merged"]
+        merged = EnumHelper.merge("MergedForSource", FirstStrEnum, NumberEnum)
+
+        generated_members = [(member.name, member.value) for member in generated]
+        merged_members = [(member.name, member.value) for member in merged]  # type: ignore[attr-defined]
+        assert generated_members == merged_members
@@ -1,25 +1,33 @@
 from collections.abc import AsyncGenerator
-from types import SimpleNamespace
 
 import pytest
 from httpx import ASGITransport
 from httpx import AsyncClient
 
 from src.http.app import app
+from src.http.dependencies.services import Services
+from src.http.dependencies.services import bind_services
+from src.http.dependencies.services import get_services
 from src.infrastructure.security.password_hasher import BcryptPasswordHasher
 from src.infrastructure.smtp.email_service import LoggerEmailService
+from src.infrastructure.tasks.task_scheduler import AsyncioTaskScheduler
 
 
 @pytest.fixture(autouse=True)
 def ensure_app_services_initialized() -> None:
-    """Ensure app.state.services is initialized for HTTP tests."""
-    if not hasattr(app.state, "services") or app.state.services is None:
+    """Ensure app services are bound for HTTP tests."""
+    try:
+        get_services()
+    except RuntimeError:
         # Note: These are local implementations (BcryptPasswordHasher, LoggerEmailService),
         # so we use real instances. If these were remote services or APIs, we should mock
         # them to avoid external dependencies and keep tests fast and reliable.
-        app.state.services = SimpleNamespace(
-            password_hasher=BcryptPasswordHasher(),
-            email_service=LoggerEmailService(),
+        bind_services(
+            Services(
+                password_hasher=BcryptPasswordHasher(),
+                email_service=LoggerEmailService(),
+                task_scheduler=AsyncioTaskScheduler(),
+            )
         )
 
 
@@ -1,13 +1,14 @@
+from collections.abc import Iterator
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
 from fastapi import HTTPException
-from fastapi import Request
 from fastapi import status
 from fastapi.security import HTTPBasicCredentials
 
+from src.application.registration.ports.password_hasher import PasswordHasher
 from src.domain.user.entities.user import User
 from src.domain.user.entities.user import UserId
 from src.domain.user.entities.user import UserPublicId
@@ -30,11 +31,11 @@ class TestGetAuthenticatedUserFromBasicAuth:
         return credentials
 
     @pytest.fixture
-    def mock_request(self) -> MagicMock:
-        """Create mock FastAPI Request with app state."""
-        request = MagicMock(spec=Request)
-        request.app.state.services = MagicMock()
-        return request
+    def mock_services(self) -> Iterator[MagicMock]:
+        """Create mock app services, as returned to the dependency."""
+        services = MagicMock()
+        with patch("src.http.dependencies.auth.get_services", return_value=services):
+            yield services
 
     @pytest.fixture
     def mock_conn(self) -> MagicMock:
@@ -44,7 +45,7 @@ class TestGetAuthenticatedUserFromBasicAuth:
     @pytest.fixture
     def mock_password_hasher(self) -> MagicMock:
         """Create mock PasswordHasher."""
-        return MagicMock()
+        return MagicMock(spec=PasswordHasher)
 
     @pytest.fixture
     def sample_user(self) -> User:
@@ -68,7 +69,7 @@ class TestGetAuthenticatedUserFromBasicAuth:
     async def test_authenticates_user_successfully(  # noqa: PLR0913
         self,
         mock_credentials: MagicMock,
-        mock_request: MagicMock,
+        mock_services: MagicMock,
         mock_conn: MagicMock,
         mock_password_hasher: MagicMock,
         mock_user_repository: MagicMock,
@@ -76,7 +77,7 @@ class TestGetAuthenticatedUserFromBasicAuth:
     ) -> None:
         """Test successful authentication with valid credentials."""
         # Setup mocks
-        mock_request.app.state.services.password_hasher = mock_password_hasher
+        mock_services.password_hasher = mock_password_hasher
         mock_password_hasher.verify.return_value = True
 
         with patch(
@@ -86,7 +87,6 @@ class TestGetAuthenticatedUserFromBasicAuth:
             # Execute
             result = await get_authenticated_user_from_basic_auth(
                 credentials=mock_credentials,
-                request=mock_request,
                 conn=mock_conn,
             )
 
@@ -107,7 +107,7 @@ class TestGetAuthenticatedUserFromBasicAuth:
     @pytest.mark.asyncio
     async def test_raises_http_exception_when_email_missing(
         self,
-        mock_request: MagicMock,
+        mock_services: MagicMock,
         mock_conn: MagicMock,
     ) -> None:
         """Test that missing email raises HTTPException."""
@@ -119,7 +119,6 @@ class TestGetAuthenticatedUserFromBasicAuth:
         with pytest.raises(HTTPException) as exc_info:
             await get_authenticated_user_from_basic_auth(
                 credentials=credentials,
-                request=mock_request,
                 conn=mock_conn,
             )
 
@@ -130,7 +129,7 @@ class TestGetAuthenticatedUserFromBasicAuth:
     @pytest.mark.asyncio
     async def test_raises_http_exception_when_password_missing(
         self,
-        mock_request: MagicMock,
+        mock_services: MagicMock,
         mock_conn: MagicMock,
     ) -> None:
         """Test that missing password raises HTTPException."""
@@ -142,7 +141,6 @@ class TestGetAuthenticatedUserFromBasicAuth:
         with pytest.raises(HTTPException) as exc_info:
             await get_authenticated_user_from_basic_auth(
                 credentials=credentials,
-                request=mock_request,
                 conn=mock_conn,
             )
 
@@ -154,13 +152,13 @@ class TestGetAuthenticatedUserFromBasicAuth:
     async def test_raises_http_exception_when_user_not_found(
         self,
         mock_credentials: MagicMock,
-        mock_request: MagicMock,
+        mock_services: MagicMock,
         mock_conn: MagicMock,
         mock_password_hasher: MagicMock,
     ) -> None:
         """Test that UserNotFoundError raises HTTPException."""
         # Setup mocks
-        mock_request.app.state.services.password_hasher = mock_password_hasher
+        mock_services.password_hasher = mock_password_hasher
         mock_user_repository = MagicMock()
         mock_user_repository.find_by_email = AsyncMock(
             side_effect=UserNotFoundError("User not found.")
@@ -176,7 +174,6 @@ class TestGetAuthenticatedUserFromBasicAuth:
             # Execute and verify exception
             await get_authenticated_user_from_basic_auth(
                 credentials=mock_credentials,
-                request=mock_request,
                 conn=mock_conn,
             )
 
@@ -191,7 +188,7 @@ class TestGetAuthenticatedUserFromBasicAuth:
     async def test_raises_http_exception_when_password_invalid_format(  # noqa: PLR0913
         self,
         mock_credentials: MagicMock,
-        mock_request: MagicMock,
+        mock_services: MagicMock,
         mock_conn: MagicMock,
         mock_password_hasher: MagicMock,
         mock_user_repository: MagicMock,
@@ -199,7 +196,7 @@ class TestGetAuthenticatedUserFromBasicAuth:
     ) -> None:
         """Test that invalid password format (ValueError) raises HTTPException."""
         # Setup mocks
-        mock_request.app.state.services.password_hasher = mock_password_hasher
+        mock_services.password_hasher = mock_password_hasher
         # Password validation raises ValueError for invalid format
         mock_credentials.password = "weak"  # noqa: S105 - This is a test password
 
@@ -213,7 +210,6 @@ class TestGetAuthenticatedUserFromBasicAuth:
             # Execute and verify exception
             await get_authenticated_user_from_basic_auth(
                 credentials=mock_credentials,
-                request=mock_request,
                 conn=mock_conn,
             )
 
@@ -231,7 +227,7 @@ class TestGetAuthenticatedUserFromBasicAuth:
     async def test_raises_http_exception_when_password_verification_fails(  # noqa: PLR0913
         self,
         mock_credentials: MagicMock,
-        mock_request: MagicMock,
+        mock_services: MagicMock,
         mock_conn: MagicMock,
         mock_password_hasher: MagicMock,
         mock_user_repository: MagicMock,
@@ -239,7 +235,7 @@ class TestGetAuthenticatedUserFromBasicAuth:
     ) -> None:
         """Test that wrong password raises HTTPException."""
         # Setup mocks
-        mock_request.app.state.services.password_hasher = mock_password_hasher
+        mock_services.password_hasher = mock_password_hasher
         mock_password_hasher.verify.return_value = False  # Password verification fails
 
         with (
@@ -252,7 +248,6 @@ class TestGetAuthenticatedUserFromBasicAuth:
             # Execute and verify exception
             await get_authenticated_user_from_basic_auth(
                 credentials=mock_credentials,
-                request=mock_request,
                 conn=mock_conn,
             )
 
@@ -270,7 +265,7 @@ class TestGetAuthenticatedUserFromBasicAuth:
     async def test_raises_http_exception_when_password_validation_raises_exception_group(  # noqa: PLR0913
         self,
         mock_credentials: MagicMock,
-        mock_request: MagicMock,
+        mock_services: MagicMock,
         mock_conn: MagicMock,
         mock_password_hasher: MagicMock,
         mock_user_repository: MagicMock,
@@ -278,7 +273,7 @@ class TestGetAuthenticatedUserFromBasicAuth:
     ) -> None:
         """Test that ExceptionGroup from password validation raises HTTPException."""
         # Setup mocks
-        mock_request.app.state.services.password_hasher = mock_password_hasher
+        mock_services.password_hasher = mock_password_hasher
         # Password validation raises ExceptionGroup for invalid format
         exception_group = ExceptionGroup(
             "Password validation failed", [ValueError("Too weak")]
@@ -298,7 +293,6 @@ class TestGetAuthenticatedUserFromBasicAuth:
             # Execute and verify exception
             await get_authenticated_user_from_basic_auth(
                 credentials=mock_credentials,
-                request=mock_request,
                 conn=mock_conn,
             )
 
@@ -0,0 +1,29 @@
+from enum import StrEnum
+from typing import cast
+
+from src.domain.user.errors import UserErrorCode
+from src.helpers.enum import EnumHelper
+from src.http.error_management.error_code import DatabaseErrorCode
+from src.http.error_management.error_code import ErrorCode
+from src.http.error_management.error_code import HttpErrorCode
+
+
+class TestErrorCode:
+    """Test the generated ErrorCode enum."""
+
+    def test_generated_error_code_is_up_to_date(self) -> None:
+        """Test that ErrorCode matches the merge of its source enums.
+
+        If this fails, regenerate it with `make error-code`.
+        """
+        # The source enums are all StrEnums, so the merge is a StrEnum class
+        merged = cast(
+            "type[StrEnum]",
+            EnumHelper.merge(
+                "ErrorCode", HttpErrorCode, UserErrorCode, DatabaseErrorCode
+            ),
+        )
+
+        assert [(code.name, code.value) for code in ErrorCode] == [
+            (code.name, code.value) for code in merged
+        ]
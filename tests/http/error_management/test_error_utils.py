@@ -0,0 +1,44 @@
+from src.http.error_management.error_utils import extract_exceptions
+
+
+class TestExtractExceptions:
+    """Test extract_exceptions() function."""
+
+    def test_flat_group_returns_its_exceptions(self) -> None:
+        """Test that a flat group returns its exceptions in order."""
+        first = ValueError("first")
+        second = TypeError("second")
+
+        result = extract_exceptions(ExceptionGroup("group", [first, second]))
+
+        assert result == [first, second]
+
+    def test_nested_groups_are_flattened_in_order(self) -> None:
+        """Test that nested groups are flattened, preserving grouping order."""
+        first = ValueError("first")
+        second = ValueError("second")
+        third = ValueError("third")
+        fourth = ValueError("fourth")
+        exception_group = ExceptionGroup(
+            "outer",
+            [
+                first,
+                ExceptionGroup("inner", [second, ExceptionGroup("deep", [third])]),
+                fourth,
+            ],
+        )
+
+        result = extract_exceptions(exception_group)
+
+        assert result == [first, second, third, fourth]
+
+    def test_deeply_nested_group_does_not_recurse(self) -> None:
+        """Test that deep nesting does not hit the recursion limit."""
+        leaf = ValueError("leaf")
+        exception_group = ExceptionGroup("level", [leaf])
+        for _ in range(5_000):
+            exception_group = ExceptionGroup("level", [exception_group])
+
+        result = extract_exceptions(exception_group)
+
+        assert result == [leaf]
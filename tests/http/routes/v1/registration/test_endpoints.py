@@ -117,6 +117,43 @@ class TestRegisterUserEndpoint:
             # Clean up overrides
             app.dependency_overrides.clear()
 
+    @pytest.mark.asyncio
+    async def test_register_user_normalizes_email(
+        self,
+        async_client: AsyncClient,
+        mock_register_user_use_case: MagicMock,
+        mock_issue_activation_code_use_case: MagicMock,
+        sample_user: User,
+    ) -> None:
+        """Test registration lowercases the email domain before the use case."""
+        # Setup mocks
+        mock_register_user_use_case.execute = AsyncMock(return_value=sample_user)
+        mock_issue_activation_code_use_case.execute = AsyncMock()
+
+        # Override dependencies
+        app.dependency_overrides[get_register_user_use_case] = (
+            lambda: mock_register_user_use_case
+        )
+        app.dependency_overrides[get_issue_activation_code_use_case] = (
+            lambda: mock_issue_activation_code_use_case
+        )
+
+        try:
+            # Execute with a mixed-case domain
+            response = await async_client.post(
+                "/v1/register",
+                json={"email": "Test@EXAMPLE.com", "password": "ValidPass123!"},
+            )
+
+            # Verify the local part is kept and the domain lowercased
+            assert response.status_code == status.HTTP_201_CREATED
+            mock_register_user_use_case.execute.assert_called_once_with(
+                email="Test@example.com",
+                password="ValidPass123!",  # noqa: S106 - Test password
+            )
+        finally:
+            app.dependency_overrides.clear()
+
     @pytest.mark.asyncio
     async def test_register_user_conflict(
         self,
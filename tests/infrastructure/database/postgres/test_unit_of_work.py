@@ -0,0 +1,57 @@
+from uuid import uuid4
+
+import asyncpg
+import pytest
+
+from src.domain.user.errors import UserNotFoundError
+from src.domain.user.value_objects.password_hash import PasswordHash
+from src.infrastructure.database.postgres.repositories.user_repository import (
+    PostgresUserRepository,
+)
+from src.infrastructure.database.postgres.unit_of_work import PostgresUnitOfWork
+
+
+@pytest.fixture
+def unit_of_work(
+    db_connection: asyncpg.pool.PoolConnectionProxy,
+) -> PostgresUnitOfWork:
+    """Provide a PostgresUnitOfWork sharing the repositories' connection."""
+    return PostgresUnitOfWork(connection=db_connection)
+
+
+class TestPostgresUnitOfWork:
+    """Tests for the PostgreSQL unit of work."""
+
+    async def test_commits_writes_on_success(
+        self,
+        unit_of_work: PostgresUnitOfWork,
+        user_repository: PostgresUserRepository,
+    ) -> None:
+        """Test that writes made inside the unit of work are kept."""
+        email = f"test_uow_{uuid4().hex[:8]}@example.com"
+
+        async with unit_of_work:
+            user = await user_repository.create(
+                email, PasswordHash(value="$2b$04$test_hash")
+            )
+
+        found_user = await user_repository.find_by_email(email)
+        assert found_user.id == user.id
+
+    async def test_rolls_back_writes_on_error(
+        self,
+        unit_of_work: PostgresUnitOfWork,
+        user_repository: PostgresUserRepository,
+    ) -> None:
+        """Test that writes made inside the unit of work are discarded on error."""
+        email = f"test_uow_{uuid4().hex[:8]}@example.com"
+
+        with pytest.raises(RuntimeError, match="Boom"):
+            async with unit_of_work:
+                await user_repository.create(
+                    email, PasswordHash(value="$2b$04$test_hash")
+                )
+                raise RuntimeError("Boom")
+
+        with pytest.raises(UserNotFoundError):
+            await user_repository.find_by_email(email)
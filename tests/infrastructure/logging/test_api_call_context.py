@@ -0,0 +1,128 @@
+from uuid import UUID
+
+from src.infrastructure.logging.api_call_context import ApiCallRequestContext
+from src.infrastructure.logging.api_call_context import ApiCallResponseContext
+from src.infrastructure.logging.api_call_context import RedactedHeaders
+from src.infrastructure.logging.api_call_context import get_request_id
+from src.infrastructure.logging.api_call_context import redact_headers
+
+
+class TestRedactedHeaders:
+    """Test RedactedHeaders mapping."""
+
+    def test_headers_are_decoded(self) -> None:
+        """Test that raw header pairs are exposed as decoded strings."""
+        headers = RedactedHeaders([(b"content-type", b"application/json")])
+
+        assert dict(headers) == {"content-type": "application/json"}
+        assert headers["content-type"] == "application/json"
+        assert len(headers) == 1
+
+    def test_sensitive_headers_are_redacted(self) -> None:
+        """Test that credentials are redacted when the headers are read."""
+        headers = RedactedHeaders(
+            [
+                (b"authorization", b"Bearer secret"),
+                (b"x-api-key", b"secret"),
+                (b"cookie", b"session=secret"),
+                (b"accept", b"*/*"),
+            ]
+        )
+
+        assert dict(headers) == {
+            "authorization": "Bearer [REDACTED]",
+            "x-api-key": "[REDACTED]",
+            "cookie": "[REDACTED]",
+            "accept": "*/*",
+        }
+
+    def test_last_duplicate_header_wins(self) -> None:
+        """Test that duplicate headers keep the last value, as a dict would."""
+        headers = RedactedHeaders([(b"accept", b"text/html"), (b"accept", b"*/*")])
+
+        assert headers["accept"] == "*/*"
+
+
+class TestGetRequestId:
+    """Test get_request_id() function."""
+
+    def test_canonical_request_id_is_kept(self) -> None:
+        """Test that a canonical UUID header value is returned unchanged."""
+        request_id = "01234567-89ab-cdef-0123-456789abcdef"
+
+        assert get_request_id(request_id) == request_id
+
+    def test_request_id_is_normalized(self) -> None:
+        """Test that other UUID spellings are normalized to the canonical form."""
+        expected = "01234567-89ab-cdef-0123-456789abcdef"
+
+        assert get_request_id("0123456789abcdef0123456789abcdef") == expected
+        assert get_request_id("01234567-89AB-CDEF-0123-456789ABCDEF") == expected
+
+    def test_missing_or_invalid_request_id_is_generated(self) -> None:
+        """Test that a new UUID is generated when the header is unusable."""
+        for request_id in (None, "", "not-a-uuid"):
+            generated = get_request_id(request_id)
+
+            assert str(UUID(generated)) == generated
+            assert generated != request_id
+
+
+class TestRedactHeaders:
+    """Test redact_headers() function."""
+
+    def test_header_names_are_matched_case_insensitively(self) -> None:
+        """Test that sensitive headers are redacted whatever their casing."""
+        headers = redact_headers(
+            {
+                "Authorization": "Basic secret",
+                "X-Auth-Token": "secret",
+                "Set-Cookie": "session=secret",
+                "Content-Type": "application/json",
+            }
+        )
+
+        assert headers == {
+            "Authorization": "Bearer [REDACTED]",
+            "X-Auth-Token": "[REDACTED]",
+            "Set-Cookie": "[REDACTED]",
+            "Content-Type": "application/json",
+        }
+
+
+class TestApiCallContextAsDict:
+    """Test ApiCallRequestContext and ApiCallResponseContext as_dict() methods."""
+
+    def test_request_context_as_dict(self) -> None:
+        """Test that the request context is logged under snake_case keys."""
+        headers = RedactedHeaders([(b"accept", b"*/*")])
+        context = ApiCallRequestContext(
+            method="GET",
+            url_path="/v1/register",
+            request_headers=headers,
+            request_id="01234567-89ab-cdef-0123-456789abcdef",
+        )
+
+        assert context.as_dict() == {
+            "method": "GET",
+            "url_path": "/v1/register",
+            "request_headers": headers,
+            "request_id": "01234567-89ab-cdef-0123-456789abcdef",
+        }
+
+    def test_response_context_as_dict(self) -> None:
+        """Test that the response context is logged under snake_case keys."""
+        headers = RedactedHeaders([(b"content-type", b"application/json")])
+        context = ApiCallResponseContext(
+            status_code=201,
+            response_time_ms=1.5,
+            response_headers=headers,
+            request_id="01234567-89ab-cdef-0123-456789abcdef",
+        )
+
+        assert context.as_dict() == {
+            "status_code": 201,
+            "response_time_ms": 1.5,
+            "response_headers": headers,
+            "request_id": "01234567-89ab-cdef-0123-456789abcdef",
+        }
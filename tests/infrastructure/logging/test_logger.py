@@ -0,0 +1,75 @@
+import json
+import logging
+from contextvars import copy_context
+from typing import Any
+from typing import cast
+
+from src.infrastructure.logging.api_call_context import RedactedHeaders
+from src.infrastructure.logging.logger import ApiCallContextFilter
+from src.infrastructure.logging.logger import JsonFormatter
+from src.infrastructure.logging.logger import request_context_var
+
+
+class TestJsonFormatter:
+    """Test JsonFormatter.format() method."""
+
+    def test_record_is_formatted_as_json_with_context_fields(self) -> None:
+        """Test that the message and API call context fields are serialized."""
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname=__file__,
+            lineno=1,
+            msg="%s %s",
+            args=("GET", "/v1/register"),
+            exc_info=None,
+        )
+        record.json_fields = {
+            "request_headers": RedactedHeaders([(b"authorization", b"secret")]),
+            "status_code": 201,
+        }
+
+        data = json.loads(JsonFormatter().format(record))
+
+        assert data["level"] == "INFO"
+        assert data["logger"] == "test"
+        assert data["message"] == "GET /v1/register"
+        assert data["request_headers"] == {"authorization": "Bearer [REDACTED]"}
+        assert data["status_code"] == 201  # noqa: PLR2004
+
+
+class TestApiCallContextFilter:
+    """Test ApiCallContextFilter.filter() method."""
+
+    def _make_record(self) -> logging.LogRecord:
+        return logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname=__file__,
+            lineno=1,
+            msg="message",
+            args=None,
+            exc_info=None,
+        )
+
+    def test_record_is_untouched_outside_a_request(self) -> None:
+        """Test that no json_fields are attached when there is no API call context."""
+        record = self._make_record()
+
+        assert ApiCallContextFilter().filter(record) is True
+        assert not hasattr(record, "json_fields")
+
+    def test_request_context_is_added_to_json_fields(self) -> None:
+        """Test that the request context is copied into the record's json_fields."""
+        record = self._make_record()
+
+        def filter_in_request() -> bool:
+            request_context_var.set({"method": "GET", "url_path": "/v1/register"})
+            return ApiCallContextFilter().filter(record)
+
+        # Run in a copied context so the context variable does not leak
+        assert copy_context().run(filter_in_request) is True
+        # The filter sets json_fields in the record's __dict__: LogRecord does not
+        # declare it
+        json_fields = cast("dict[str, Any]", record.__dict__["json_fields"])
+        assert json_fields == {"method": "GET", "url_path": "/v1/register"}
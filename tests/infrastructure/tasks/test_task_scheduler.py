@@ -0,0 +1,64 @@
+import asyncio
+from unittest.mock import patch
+
+from src.infrastructure.tasks.task_scheduler import AsyncioTaskScheduler
+
+
+class TestAsyncioTaskScheduler:
+    """Test AsyncioTaskScheduler."""
+
+    async def test_schedule_runs_coroutine_in_background(self) -> None:
+        """Test that a scheduled coroutine runs without being awaited by the caller."""
+        scheduler = AsyncioTaskScheduler()
+        done = asyncio.Event()
+
+        async def work() -> None:
+            done.set()
+
+        scheduler.schedule(work())
+
+        # Not run yet: schedule() returns before the task gets a chance to execute
+        assert not done.is_set()
+
+        await asyncio.wait_for(done.wait(), timeout=1)
+        assert done.is_set()
+
+    async def test_wait_for_pending_waits_for_scheduled_tasks(self) -> None:
+        """Test that wait_for_pending() returns once every scheduled task completed."""
+        scheduler = AsyncioTaskScheduler()
+        results: list[int] = []
+
+        async def work(value: int) -> None:
+            await asyncio.sleep(0)
+            results.append(value)
+
+        scheduler.schedule(work(1))
+        scheduler.schedule(work(2))
+
+        await scheduler.wait_for_pending()
+
+        assert sorted(results) == [1, 2]
+
+    async def test_wait_for_pending_without_tasks(self) -> None:
+        """Test that wait_for_pending() returns immediately when nothing is scheduled."""
+        scheduler = AsyncioTaskScheduler()
+
+        await scheduler.wait_for_pending()
+
+    async def test_failed_task_is_logged(self) -> None:
+        """Test that an exception raised by a background task is logged, not lost."""
+        scheduler = AsyncioTaskScheduler()
+        error = RuntimeError("Email provider unavailable")
+
+        async def failing_work() -> None:
+            raise error
+
+        with patch("src.infrastructure.tasks.task_scheduler.logger") as mock_logger:
+            scheduler.schedule(failing_work())
+            await scheduler.wait_for_pending()
+            # Done callbacks run on the next loop iteration
+            await asyncio.sleep(0)
+
+        mock_logger.error.assert_called_once_with(
+            "Background task failed", exc_info=error
+        )